@@ -1,17 +1,35 @@
 import os
 import sys
+import atexit
 import struct
+import io
+import mmap
+import ctypes
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import shutil
 import tempfile
 import subprocess
 import threading
+import queue
 import json
-import glob
+import logging
+import hashlib
+import base64
+import functools
+import itertools
 import time
 import zipfile
+import zlib
+import weakref
 import urllib.request
+import urllib.parse
+import urllib.error
+import http.client
+import contextlib
+from collections import OrderedDict
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -22,6 +40,8 @@ except ImportError:
     messagebox.showerror("Missing Dependencies", "Pillow library is required but not installed.\nPlease install it manually: pip install Pillow")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 # --- SETTINGS & PATH MANAGEMENT ---
 SETTINGS_DIR_NAME = "Settings"
 
@@ -40,15 +60,23 @@ def get_settings_path(filename):
         except: pass
     return os.path.join(settings_dir, filename)
 
+TOOL_PATHS = {} # tool name -> resolved path, only filled once the tool has been found
+
 def get_tool_path(tool_name):
+    path = TOOL_PATHS.get(tool_name)
+    if path:
+        return path
+    
     # Check Settings folder first
     settings_path = get_settings_path(tool_name)
     if os.path.exists(settings_path):
+        TOOL_PATHS[tool_name] = settings_path
         return settings_path
     
     # Fallback to script dir for backward compatibility or initial setup
     script_path = os.path.join(get_base_dir(), tool_name)
     if os.path.exists(script_path):
+        TOOL_PATHS[tool_name] = script_path
         return script_path
         
     return settings_path # Return the Settings path even if missing, so we know where it SHOULD be
@@ -58,10 +86,70 @@ CACHE_DIR = "texture_cache" # Image cache (thumbnails)
 CACHE2_FILE = get_settings_path("cache2.json") # New optimized cache
 LEGACY_CACHE_FILE = get_settings_path("cache.json")
 MAPPING_FILE = get_settings_path("texture_mapping.json")
+DECODE_CACHE_FILE = get_settings_path("decode_cache.json") # ASTC decode configs, journaled next to it as .jsonl
+
+# Texture / corresponding-data folder IDs inside an extracted package
+QUEST_TEXTURES_ID = "5231972605540061417"
+QUEST_CORRESPONDING_ID = "-2094201140079393352"
+PCVR_TEXTURES_ID = "-4707359568332879775"
+PCVR_CORRESPONDING_ID = "5353709876897953952"
+# textures folder -> (corresponding folder, is Quest)
+FOLDER_LAYOUTS = {
+    QUEST_TEXTURES_ID: (QUEST_CORRESPONDING_ID, True),
+    PCVR_TEXTURES_ID: (PCVR_CORRESPONDING_ID, False),
+}
+
+TEXTURE_CACHE_URL = "https://github.com/heisthecat31/EchoVR-Texture-Editor/releases/download/quest/texture_cache.zip"
+# Per-platform halves of the combined archive; the combined one stays as the fallback
+TEXTURE_CACHE_PLATFORM_URLS = {
+    'quest': "https://github.com/heisthecat31/EchoVR-Texture-Editor/releases/download/quest/texture_cache_quest.zip",
+    'pcvr': "https://github.com/heisthecat31/EchoVR-Texture-Editor/releases/download/pcvr/texture_cache_pcvr.zip",
+}
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# The payloads are already zip archives, so never ask for a transfer encoding on top
+DOWNLOAD_HEADERS = {'Accept-Encoding': 'identity', 'User-Agent': 'EVRTexEditor/1.0'}
+
+# .astc file header: magic, block dims, then 24-bit little-endian image dims
+ASTC_HEADER = struct.Struct("<I3B9B")
+# DDS signature + header fields we read: height, width, mip count, pixel format flags, fourCC
+DDS_HEADER = struct.Struct("<4s8xII8xI48xI4s")
+DDS_DX10_FORMAT = struct.Struct("<I") # dxgiFormat, first field after the 128-byte header
+# Full 148-byte DDS + DX10 header: signature, header up to mip count, reserved, pixel format, caps, DX10 extension
+DDS_DX10_FILE_HEADER = struct.Struct("<4s7I44xII4s5I5I5I")
+# Texture byte size stored in a corresponding file
+CORRESPONDING_SIZE = struct.Struct("<I")
+CORRESPONDING_SIZE_OFFSET = 244
+# Zip local file header: signature, then the name/extra lengths that precede the member data
+ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
 
 DECODE_CACHE = {}
+DECODE_CACHE_LOCK = threading.Lock()
+# Entries not yet appended to the on-disk journal, and how many lines the journal holds
+DECODE_CACHE_JOURNAL = {'dirty': set(), 'lines': 0, 'rewrite': False}
+ADB_STATUS_TTL = 5 # seconds a check_adb result is reused
+ADB_STATUS_CACHE = {'ts': 0, 'result': None}
+WORKER_POOL_SIZE = min(8, os.cpu_count() or 4)
+SNIFF_WORKERS = 8 # threads reading DDS signatures during a full folder scan
+SNIFF_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOATIME', 0)
+ADB_PUSH_WORKERS = 4 # concurrent adb push processes when a folder push falls back to per-entry
+TEXCONV_FORMAT_CODES = (
+    ("DXGI_FORMAT_BC1", 71),
+    ("DXGI_FORMAT_BC3", 77),
+    ("DXGI_FORMAT_BC4", 80),
+    ("DXGI_FORMAT_BC5", 83),
+    ("DXGI_FORMAT_R11G11B10_FLOAT", 26),
+)
+PREVIEW_REDUCING_GAP = 2.0 # final resample filter works on at most this multiple of the target size
+PHOTO_CACHE_SIZE = 16 # resized PhotoImages kept for redrawing recently shown previews
+REPLACEMENT_CACHE_SIZE = 8 # decoded replacement images kept for picking the same file again
+FILTER_DEBOUNCE_MS = 150 # quiet time after the last key press before the texture list is refiltered
+LOADED_IMAGE_CACHE_SIZE = 32 # Decoded previews kept in memory, full-size RGBA so keep it small
+LOADED_IMAGE_CACHE_BYTES = 256 * 1024 * 1024 # ...and never more than this much pixel data
+CACHE_PNG_COMPRESS_LEVEL = 1 # cache PNGs are rewritten often and read locally; favour encode speed over size
+CACHE_WRITE_QUEUE_SIZE = 8 # decoded images waiting for the cache writer; full-size copies, so keep it short
 
 def run_hidden_command(cmd, cwd=None, timeout=None, capture_output=True):
+    # capture_output=False discards the child's streams (DEVNULL) rather than inheriting the console
     if sys.platform == 'win32':
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -88,6 +176,7 @@ def run_hidden_command(cmd, cwd=None, timeout=None, capture_output=True):
                 result = subprocess.run(
                     cmd, 
                     startupinfo=startupinfo,
+                    stdin=subprocess.DEVNULL,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                     cwd=cwd,
@@ -101,7 +190,7 @@ def run_hidden_command(cmd, cwd=None, timeout=None, capture_output=True):
         if capture_output:
             return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=timeout)
         else:
-            return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=cwd, timeout=timeout)
+            return subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=cwd, timeout=timeout)
 
 # --- NEW CACHE MANAGER CLASS ---
 class TextureCacheManager:
@@ -135,8 +224,19 @@ class TextureCacheManager:
         TextureCacheManager.save_cache(cache)
 
 class ConfigManager:
+    _cached = None # last loaded/saved config, so saves don't re-read and re-resolve the file
+    SAVE_DELAY = 0.5 # seconds; saves arriving closer together than this become one write
+    _save_timer = None
+    _save_lock = threading.RLock()
+
     @staticmethod
     def load_config():
+        if ConfigManager._cached is None:
+            ConfigManager._cached = ConfigManager.read_config()
+        return dict(ConfigManager._cached)
+
+    @staticmethod
+    def read_config():
         base_dir = get_base_dir()
         
         default_config = {
@@ -176,20 +276,44 @@ class ConfigManager:
                                         value = parent_path
                             default_config[key] = value
         except Exception as e:
-            print(f"Config load error: {e}")
+            logger.warning("Config load error: %s", e)
         
         return default_config
     
     @staticmethod
     def save_config(**kwargs):
-        config = ConfigManager.load_config()
-        config.update(kwargs)
-        
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=4)
-        except Exception as e:
-            print(f"Config save error: {e}")
+        # The in-memory config updates right away; the file write happens shortly after on a
+        # timer thread, so picking several folders in a row costs one write off the Tk thread
+        with ConfigManager._save_lock:
+            config = ConfigManager.load_config()
+            config.update(kwargs)
+            ConfigManager._cached = config
+            
+            if ConfigManager._save_timer:
+                ConfigManager._save_timer.cancel()
+            ConfigManager._save_timer = threading.Timer(ConfigManager.SAVE_DELAY, ConfigManager.flush_config)
+            ConfigManager._save_timer.daemon = True
+            ConfigManager._save_timer.start()
+
+    @staticmethod
+    def flush_config():
+        with ConfigManager._save_lock:
+            if ConfigManager._save_timer is None:
+                return
+            ConfigManager._save_timer.cancel()
+            ConfigManager._save_timer = None
+            config = dict(ConfigManager._cached)
+            
+            # Write beside the real file and swap it in, so a crash mid-write can't leave broken JSON
+            temp_file = CONFIG_FILE + ".tmp"
+            try:
+                with open(temp_file, 'w') as f:
+                    json.dump(config, f, indent=4)
+                os.replace(temp_file, CONFIG_FILE)
+            except Exception as e:
+                logger.warning("Config save error: %s", e)
+
+atexit.register(ConfigManager.flush_config)
 
 class TutorialPopup:
     @staticmethod
@@ -546,6 +670,260 @@ Always create a backup before proceeding."""
             error_msg = f"Failed to update packages:\n{str(e)}"
             messagebox.showerror("Error", error_msg)
 
+def preallocate_file(f, size):
+    # Reserve the whole file up front so the filesystem can hand out contiguous extents
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            f.truncate(size)
+    except OSError:
+        pass
+
+FICLONE = 0x40049409 # Linux copy-on-write clone ioctl
+
+def fast_copy(src, dst):
+    # Clone instead of copying where the filesystem can (btrfs, XFS, ...), plain copy otherwise.
+    # Never a hardlink: copies get patched in place right after (hex_edit_file_size).
+    if sys.platform.startswith('linux'):
+        try:
+            import fcntl
+            with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+@functools.lru_cache(maxsize=1)
+def get_worker_pool():
+    # One long-lived pool for short decode jobs (astcenc candidates), so a load
+    # doesn't spin up and tear down its own threads. Jobs submitted here must never wait on
+    # other jobs from this pool.
+    return ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE, thread_name_prefix="evr-decode")
+
+class DownloadSession:
+    # Keeps idle keep-alive connections per host so requests to the same host (checksum
+    # sidecars, repeat downloads) reuse one TCP/TLS session instead of handshaking every time
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(self, headers=None, timeout=60, max_redirects=5):
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        # Same proxy settings urlopen honours: *_proxy variables, else the registry / system config
+        self.proxies = urllib.request.getproxies()
+        self._idle = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _get_proxy(self, scheme, host):
+        proxy = self.proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(urllib.parse.urlsplit('//' + host).hostname or host):
+            return None
+        return urllib.parse.urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+
+    @staticmethod
+    def get_proxy_headers(proxy):
+        if not proxy.username:
+            return {}
+        credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        return {'Proxy-Authorization': 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')}
+
+    def _connect(self, scheme, host):
+        proxy = self._get_proxy(scheme, host)
+        if proxy is None:
+            conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            return conn_class(host, timeout=self.timeout)
+        
+        if scheme == 'https':
+            # CONNECT through the proxy, then TLS with the real host as urllib does
+            conn = http.client.HTTPSConnection(proxy.hostname, proxy.port, timeout=self.timeout)
+            conn.set_tunnel(host, headers=DownloadSession.get_proxy_headers(proxy))
+            return conn
+        return http.client.HTTPConnection(proxy.hostname, proxy.port, timeout=self.timeout)
+
+    def _checkout(self, scheme, host):
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop(), True
+        return self._connect(scheme, host), False
+
+    def _checkin(self, scheme, host, conn, response):
+        # Only a fully read response leaves the connection reusable
+        if response.isclosed() and not response.will_close:
+            self._park(scheme, host, conn)
+        else:
+            conn.close()
+
+    def _park(self, scheme, host, conn):
+        # A connection that finishes after close() would otherwise sit in the pool forever
+        with self._lock:
+            if not self._closed:
+                self._idle.setdefault((scheme, host), []).append(conn)
+                return
+        conn.close()
+
+    def _send(self, scheme, host, path):
+        headers = self.headers
+        proxy = self._get_proxy(scheme, host)
+        if proxy is not None and scheme != 'https':
+            # Plain HTTP goes to the proxy as an absolute-URI request
+            path = f"{scheme}://{host}{path}"
+            headers = dict(headers, **DownloadSession.get_proxy_headers(proxy))
+        
+        conn, reused = self._checkout(scheme, host)
+        try:
+            conn.request('GET', path, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+        
+        # The server dropped an idle keep-alive connection, retry once on a fresh one
+        conn = self._connect(scheme, host)
+        conn.request('GET', path, headers=headers)
+        return conn, conn.getresponse()
+
+    @contextlib.contextmanager
+    def get(self, url):
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            
+            conn, response = self._send(parts.scheme, parts.netloc, path)
+            
+            if response.status in self.REDIRECT_CODES:
+                location = response.getheader('Location')
+                response.read()
+                self._checkin(parts.scheme, parts.netloc, conn, response)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            
+            if response.status != 200:
+                response.read()
+                self._checkin(parts.scheme, parts.netloc, conn, response)
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            
+            try:
+                yield response
+            finally:
+                self._checkin(parts.scheme, parts.netloc, conn, response)
+            return
+        
+        raise urllib.error.URLError(f"Too many redirects: {url}")
+
+    def prewarm(self, url):
+        # Open the TCP/TLS session ahead of the first request and park it in the idle pool
+        parts = urllib.parse.urlsplit(url)
+        conn = self._connect(parts.scheme, parts.netloc)
+        try:
+            conn.connect()
+        except OSError:
+            conn.close()
+            return
+        self._park(parts.scheme, parts.netloc, conn)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+class ZipExtractor:
+    @staticmethod
+    def get_target_path(dest_dir, member_name):
+        # Same sanitising as ZipFile.extract: drop drive letters, absolute roots and ".." parts
+        parts = [p for p in member_name.replace('\\', '/').split('/') if p not in ('', '.', '..')]
+        if parts and len(parts[0]) == 2 and parts[0][1] == ':':
+            parts = parts[1:]
+        return os.path.join(dest_dir, *parts)
+
+    @staticmethod
+    def create_directories(zip_ref, dest_dir):
+        # One makedirs per unique directory instead of one per member
+        directories = set()
+        for info in zip_ref.infolist():
+            target = ZipExtractor.get_target_path(dest_dir, info.filename)
+            directories.add(target if info.is_dir() else os.path.dirname(target))
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def extract_member(zip_ref, info, dest_dir, verify_crc=True):
+        target = ZipExtractor.get_target_path(dest_dir, info.filename)
+        
+        is_plain = not (info.flag_bits & 0x1) and info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        if not verify_crc and is_plain:
+            ZipExtractor.extract_member_raw(zip_ref.filename, info, target)
+            return
+        
+        # Copy buffer sized to the member so small files become a single read()/write() pair
+        with zip_ref.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, max(1, min(info.file_size, DOWNLOAD_CHUNK_SIZE)))
+
+    @staticmethod
+    def extract_member_raw(zip_path, info, target):
+        # Inflate straight from the member's data offset, skipping ZipExtFile's per-member CRC.
+        # Only used once the whole archive has already been checked end-to-end.
+        with open(zip_path, 'rb') as src, open(target, 'wb') as dst:
+            src.seek(info.header_offset)
+            local_header = src.read(ZIP_LOCAL_HEADER.size)
+            if len(local_header) < ZIP_LOCAL_HEADER.size:
+                raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+            signature, name_len, extra_len = ZIP_LOCAL_HEADER.unpack(local_header)
+            if signature != b'PK\x03\x04':
+                raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+            src.seek(name_len + extra_len, os.SEEK_CUR)
+            
+            decompressor = zlib.decompressobj(-15) if info.compress_type == zipfile.ZIP_DEFLATED else None
+            remaining = info.compress_size
+            while remaining > 0:
+                chunk = src.read(min(remaining, DOWNLOAD_CHUNK_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+                remaining -= len(chunk)
+                dst.write(decompressor.decompress(chunk) if decompressor else chunk)
+            if decompressor:
+                dst.write(decompressor.flush())
+
+    @staticmethod
+    def extract_all(zip_path, dest_dir, max_workers=None, verify_crc=True):
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            ZipExtractor.create_directories(zip_ref, dest_dir)
+            
+            # Largest first so a big member never ends up as the straggler at the tail
+            members = sorted((info for info in zip_ref.infolist() if not info.is_dir()), key=lambda info: info.file_size, reverse=True)
+            workers = max_workers or min(8, os.cpu_count() or 4)
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(ZipExtractor.extract_member, zip_ref, info, dest_dir, verify_crc) for info in members]
+                for future in futures:
+                    future.result()
+
+    @staticmethod
+    def extract_replace(zip_path, dest_dir, verify_crc=True):
+        # Extract beside dest_dir first and only move files in with os.replace once the whole
+        # archive succeeded, so a failure never leaves half-written files. Files already in
+        # dest_dir are merged, not wiped: _internal holds the bundled runtime, locally decoded
+        # previews and possibly the other platform's cache.
+        staging_dir = f"{dest_dir}.tmp-{os.getpid()}"
+        try:
+            ZipExtractor.extract_all(zip_path, staging_dir, verify_crc=verify_crc)
+            for root, _, files in os.walk(staging_dir):
+                target_root = os.path.normpath(os.path.join(dest_dir, os.path.relpath(root, staging_dir)))
+                os.makedirs(target_root, exist_ok=True)
+                for name in files:
+                    os.replace(os.path.join(root, name), os.path.join(target_root, name))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
 class ADBPlatformTools:
     @staticmethod
     def get_safe_install_directory():
@@ -570,22 +948,21 @@ class ADBPlatformTools:
         
         script_dir = os.path.dirname(os.path.abspath(__file__))
         install_base = os.path.join(script_dir, "platform-tools")
-        download_path = os.path.join(script_dir, "platform-tools-download.zip")
         
         try:
             os.makedirs(install_base, exist_ok=True)
             
-            print(f"Downloading Platform Tools to: {download_path}")
-            urllib.request.urlretrieve(url, download_path)
-            
-            print(f"Extracting to: {install_base}")
-            with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                zip_ref.extractall(install_base)
+            # The archive is small enough to keep in memory, so it never touches the disk
+            logger.debug("Downloading Platform Tools from: %s", url)
+            with urllib.request.urlopen(url, timeout=60) as response:
+                data = response.read()
             
-            try:
-                os.remove(download_path)
-            except:
-                pass
+            logger.debug("Extracting to: %s", install_base)
+            with zipfile.ZipFile(io.BytesIO(data), 'r') as zip_ref:
+                ZipExtractor.create_directories(zip_ref, install_base)
+                for info in zip_ref.infolist():
+                    if not info.is_dir():
+                        ZipExtractor.extract_member(zip_ref, info, install_base)
             
             adb_path = os.path.join(install_base, "platform-tools", "adb.exe" if system == 'windows' else "adb")
             if not os.path.exists(adb_path):
@@ -611,6 +988,17 @@ class ADBPlatformTools:
 class ADBManager:
     @staticmethod
     def find_adb():
+        # Only a found adb is memoized, so installing platform-tools mid-session is picked up
+        path = TOOL_PATHS.get("adb")
+        if path:
+            return path
+        path = ADBManager.locate_adb()
+        if path:
+            TOOL_PATHS["adb"] = path
+        return path
+
+    @staticmethod
+    def locate_adb():
         safe_dir = ADBPlatformTools.get_safe_install_directory()
         local_paths = [
             os.path.join(safe_dir, "platform-tools", "adb.exe"),
@@ -641,27 +1029,45 @@ class ADBManager:
         return None
 
     @staticmethod
-    def check_adb():
+    def invalidate_adb_cache():
+        TOOL_PATHS.pop("adb", None)
+        ADBManager.clear_status_cache()
+
+    @staticmethod
+    def check_adb(use_cache=False):
+        # The passive refresh on every output folder change may reuse a fresh result; explicit
+        # checks (connection test, pre-push) always ask adb so a just-plugged headset shows up
+        cached = ADB_STATUS_CACHE['result']
+        if use_cache and cached and time.monotonic() - ADB_STATUS_CACHE['ts'] < ADB_STATUS_TTL:
+            return cached
+        
+        result = ADBManager.query_adb_status()
+        ADB_STATUS_CACHE['ts'] = time.monotonic()
+        ADB_STATUS_CACHE['result'] = result
+        return result
+
+    @staticmethod
+    def clear_status_cache():
+        ADB_STATUS_CACHE['ts'] = 0
+        ADB_STATUS_CACHE['result'] = None
+
+    @staticmethod
+    def query_adb_status():
         adb_path = ADBManager.find_adb()
         if not adb_path:
             return False, "ADB not found", None
         
         try:
-            try:
-                run_hidden_command([adb_path, 'kill-server'], timeout=5)
-            except:
-                pass
-            
-            result = run_hidden_command([adb_path, 'devices'], timeout=10)
+            # "devices -l" already reports each model, so no per-device getprop round-trip
+            result = run_hidden_command([adb_path, 'devices', '-l'], timeout=10)
             if result.returncode == 0:
-                lines = [line for line in result.stdout.strip().split('\n') if '\tdevice' in line]
+                lines = [line.split() for line in result.stdout.strip().split('\n')[1:]]
+                lines = [parts for parts in lines if len(parts) > 1 and parts[1] == 'device']
                 if lines:
                     devices = []
-                    for line in lines:
-                        device_id = line.split('\t')[0]
-                        info_result = run_hidden_command([adb_path, '-s', device_id, 'shell', 'getprop', 'ro.product.model'], timeout=10)
-                        model = info_result.stdout.strip() if info_result.returncode == 0 else "Unknown"
-                        devices.append(f"{device_id} ({model})")
+                    for parts in lines:
+                        model = next((p[6:].replace('_', ' ') for p in parts[2:] if p.startswith('model:')), "Unknown")
+                        devices.append(f"{parts[0]} ({model})")
                     
                     return True, f"Connected: {', '.join(devices)}", adb_path
                 else:
@@ -683,22 +1089,30 @@ class ADBManager:
             if result.returncode != 0:
                 return False, f"Failed to create directory: {result.stderr}"
             
+            with os.scandir(local_folder) as it:
+                entries = list(it)
+            total_count = len(entries)
+            
+            # One adb session for the whole folder; the trailing "/." pushes its contents
+            result = run_hidden_command([adb_path, 'push', os.path.join(local_folder, '.'), quest_path], timeout=60 * max(1, total_count))
+            if result.returncode == 0:
+                return True, f"Successfully pushed all {total_count} items to {quest_path}"
+            
+            # Retry entry by entry so the error points at whatever actually failed. Each adb client
+            # gets its own connection to the server, so a few run side by side.
             success_count = 0
-            total_count = 0
             errors = []
             
-            for item in os.listdir(local_folder):
-                item_path = os.path.join(local_folder, item)
-                if os.path.exists(item_path):
-                    total_count += 1
-                    
-                    result = run_hidden_command([adb_path, 'push', item_path, quest_path], timeout=60)
-                    
+            def push_entry(entry):
+                return run_hidden_command([adb_path, 'push', entry.path, quest_path], timeout=60)
+            
+            with ThreadPoolExecutor(max_workers=ADB_PUSH_WORKERS) as executor:
+                for entry, result in zip(entries, executor.map(push_entry, entries)):
                     if result.returncode == 0:
                         success_count += 1
                     else:
                         error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                        errors.append(f"{item}: {error_msg}")
+                        errors.append(f"{entry.name}: {error_msg}")
             
             if success_count == total_count:
                 return True, f"Successfully pushed all {success_count} items to {quest_path}"
@@ -714,9 +1128,134 @@ class ADBManager:
 
     @staticmethod
     def install_adb_tools():
-        return ADBPlatformTools.install_platform_tools()
+        result = ADBPlatformTools.install_platform_tools()
+        ADBManager.invalidate_adb_cache()
+        return result
+
+class AstcencLib:
+    # Optional in-process decoder, only active when an astcenc shared library sits in Settings.
+    # Without it everything keeps going through the astcenc CLI.
+    LIBRARY_NAMES = [
+        "astcenc-avx2-shared.dll", "astcenc-shared.dll",
+        "libastcenc-avx2-shared.so", "libastcenc-shared.so", "libastcenc-shared.dylib"
+    ]
+    PROFILE_LDR = 1
+    TYPE_U8 = 0
+    PRESET_MEDIUM = 60.0
+    SUCCESS = 0
+    # astcenc_config_init fills the struct itself, so only a large enough opaque buffer is needed
+    CONFIG_BUFFER_SIZE = 1024
+
+    class AstcImage(ctypes.Structure):
+        _fields_ = [
+            ("dim_x", ctypes.c_uint),
+            ("dim_y", ctypes.c_uint),
+            ("dim_z", ctypes.c_uint),
+            ("data_type", ctypes.c_int),
+            ("data", ctypes.POINTER(ctypes.c_void_p))
+        ]
+
+    class AstcSwizzle(ctypes.Structure):
+        _fields_ = [("r", ctypes.c_int), ("g", ctypes.c_int), ("b", ctypes.c_int), ("a", ctypes.c_int)]
+
+    _lib = None
+    _loaded = False
+    _load_lock = threading.Lock()
+    _local = threading.local()
+
+    @classmethod
+    def load(cls):
+        with cls._load_lock:
+            if cls._loaded:
+                return cls._lib
+            cls._loaded = True
+            
+            for name in cls.LIBRARY_NAMES:
+                path = get_tool_path(name)
+                if not os.path.exists(path):
+                    continue
+                try:
+                    lib = ctypes.CDLL(path)
+                    lib.astcenc_config_init.restype = ctypes.c_int
+                    lib.astcenc_config_init.argtypes = [ctypes.c_int, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint, ctypes.c_float, ctypes.c_uint, ctypes.c_void_p]
+                    lib.astcenc_context_alloc.restype = ctypes.c_int
+                    lib.astcenc_context_alloc.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+                    lib.astcenc_decompress_image.restype = ctypes.c_int
+                    lib.astcenc_decompress_image.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(cls.AstcImage), ctypes.POINTER(cls.AstcSwizzle), ctypes.c_uint]
+                    lib.astcenc_decompress_reset.restype = ctypes.c_int
+                    lib.astcenc_decompress_reset.argtypes = [ctypes.c_void_p]
+                    cls._lib = lib
+                    break
+                except (OSError, AttributeError) as e:
+                    logger.warning("astcenc library load failed (%s): %s", name, e)
+            
+            return cls._lib
+
+    @classmethod
+    def get_context(cls, block_w, block_h):
+        # Context setup is the expensive part; keep one per block size and thread since a
+        # context can only decode one image at a time
+        contexts = getattr(cls._local, 'contexts', None)
+        if contexts is None:
+            contexts = cls._local.contexts = {}
+        
+        context = contexts.get((block_w, block_h))
+        if context is None:
+            config = ctypes.create_string_buffer(cls.CONFIG_BUFFER_SIZE)
+            if cls._lib.astcenc_config_init(cls.PROFILE_LDR, block_w, block_h, 1, cls.PRESET_MEDIUM, 0, config) != cls.SUCCESS:
+                return None
+            context = ctypes.c_void_p()
+            if cls._lib.astcenc_context_alloc(config, 1, ctypes.byref(context)) != cls.SUCCESS:
+                return None
+            contexts[(block_w, block_h)] = context
+        return context
+
+    @classmethod
+    def decode(cls, data, width, height, block_w, block_h):
+        if cls.load() is None:
+            return None
+        
+        context = cls.get_context(block_w, block_h)
+        if context is None:
+            return None
+        
+        pixels = ctypes.create_string_buffer(width * height * 4)
+        slices = (ctypes.c_void_p * 1)(ctypes.cast(pixels, ctypes.c_void_p))
+        image = cls.AstcImage(width, height, 1, cls.TYPE_U8, slices)
+        swizzle = cls.AstcSwizzle(0, 1, 2, 3)
+        source = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+        
+        status = cls._lib.astcenc_decompress_image(context, source, len(data), ctypes.byref(image), ctypes.byref(swizzle), 0)
+        cls._lib.astcenc_decompress_reset(context)
+        if status != cls.SUCCESS:
+            return None
+        
+        return Image.frombuffer("RGBA", (width, height), pixels.raw, "raw", "RGBA", 0, 1)
 
 class ASTCTools:
+    BRUTE_FORCE_CONFIGS = [
+        (2048, 1024, 8, 8, "2Kx1K_8x8"),
+        (2048, 1024, 6, 6, "2Kx1K_6x6"),
+        (2048, 1024, 4, 4, "2Kx1K_4x4"),
+        (1024, 512, 8, 8, "1Kx512_8x8"),
+        (1024, 512, 6, 6, "1Kx512_6x6"),
+        (1024, 512, 4, 4, "1Kx512_4x4"),
+        (2048, 2048, 8, 8, "2K_square_8x8"),
+        (1024, 1024, 8, 8, "1K_square_8x8"),
+    ]
+    BRUTE_FORCE_SIZE_INDEX = {} # raw size -> configs, filled in below the class
+    _wrap_slots = queue.LifoQueue()
+    _wrap_slot_paths = []
+    _wrap_slot_lock = threading.Lock()
+
+    @staticmethod
+    def build_size_index(configurations):
+        index = {}
+        for config in configurations:
+            width, height, block_w, block_h = config[:4]
+            index.setdefault(ASTCTools.calculate_astc_size(width, height, block_w, block_h), []).append(config)
+        return index
+
     @staticmethod
     def load_texture_mapping(mapping_file):
         if not os.path.exists(mapping_file):
@@ -727,7 +1266,7 @@ class ASTCTools:
                 mapping = json.load(f)
             return mapping
         except Exception as e:
-            print(f"Mapping load error: {e}")
+            logger.warning("Mapping load error: %s", e)
             return {}
 
     @staticmethod
@@ -747,49 +1286,46 @@ class ASTCTools:
     @staticmethod
     def wrap_raw_astc(raw_path, wrapped_path, width, height, block_width=4, block_height=4):
         try:
-            magic = struct.pack("<I", 0x5CA1AB13)
-            block_dims = struct.pack("3B", block_width, block_height, 1)
-            
-            def dim3(x):
-                return struct.pack("<I", x)[:3]
-                
-            image_dims = dim3(width) + dim3(height) + dim3(1)
-            header = magic + block_dims + image_dims
-            data = raw_path.read_bytes()
-            wrapped_path.write_bytes(header + data)
+            header = ASTC_HEADER.pack(
+                0x5CA1AB13,
+                block_width, block_height, 1,
+                width & 0xFF, (width >> 8) & 0xFF, (width >> 16) & 0xFF,
+                height & 0xFF, (height >> 8) & 0xFF, (height >> 16) & 0xFF,
+                1, 0, 0
+            )
+            with open(raw_path, 'rb') as src, open(wrapped_path, 'wb') as dst:
+                dst.write(header)
+                if os.fstat(src.fileno()).st_size:
+                    # Hand the mapped pages to write() directly, no Python-side copy of the payload
+                    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        dst.write(mm)
             return True
         except Exception as e:
-            print(f"Wrap failed: {e}")
+            logger.debug("Wrap failed: %s", e)
             return False
 
     @staticmethod
     def decode_with_config(astcenc_path, raw_file, output_file, width, height, block_w, block_h, cache_key=None):
-        temp_astc = None
+        if AstcencLib.load() is not None:
+            return ASTCTools.decode_in_process(raw_file, output_file, width, height, block_w, block_h, cache_key)
+        
         try:
-            with tempfile.NamedTemporaryFile(suffix='.astc', delete=False) as f:
-                temp_astc = Path(f.name)
-            
-            if not ASTCTools.wrap_raw_astc(raw_file, temp_astc, width, height, block_w, block_h):
-                return False
-            
-            result = run_hidden_command([
-                str(astcenc_path),
-                "-dl",
-                str(temp_astc),
-                str(output_file)
-            ], timeout=10)
+            with ASTCTools.wrap_slot() as temp_astc:
+                if not ASTCTools.wrap_raw_astc(raw_file, temp_astc, width, height, block_w, block_h):
+                    return False
+                
+                result = run_hidden_command([
+                    str(astcenc_path),
+                    "-dl",
+                    str(temp_astc),
+                    str(output_file)
+                ], timeout=10)
             
             if result.returncode == 0 and output_file.exists():
                 file_size = output_file.stat().st_size
                 if file_size > 1000:
                     if cache_key:
-                        DECODE_CACHE[cache_key] = {
-                            'width': width,
-                            'height': height, 
-                            'block_w': block_w,
-                            'block_h': block_h,
-                            'original_size': raw_file.stat().st_size
-                        }
+                        ASTCTools.record_decode_config(cache_key, width, height, block_w, block_h, raw_file.stat())
                     return True
                 else:
                     output_file.unlink()
@@ -803,12 +1339,120 @@ class ASTCTools:
             if output_file.exists():
                 output_file.unlink()
             return False
+
+    @staticmethod
+    @contextlib.contextmanager
+    def wrap_slot():
+        # Wrapped .astc files are reused instead of created and deleted per decode. One slot per
+        # concurrent decode, kept in RAM-backed /dev/shm where available.
+        try:
+            path = ASTCTools._wrap_slots.get_nowait()
+        except queue.Empty:
+            with ASTCTools._wrap_slot_lock:
+                wrap_dir = "/dev/shm" if os.access("/dev/shm", os.W_OK) else tempfile.gettempdir()
+                path = Path(wrap_dir) / f"astc_wrap_{os.getpid()}_{len(ASTCTools._wrap_slot_paths)}.astc"
+                ASTCTools._wrap_slot_paths.append(path)
+        try:
+            yield path
         finally:
-            if temp_astc and temp_astc.exists():
+            ASTCTools._wrap_slots.put(path)
+
+    @staticmethod
+    def remove_wrap_slots():
+        for path in ASTCTools._wrap_slot_paths:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    @staticmethod
+    def decode_in_process(raw_file, output_file, width, height, block_w, block_h, cache_key=None):
+        # Same contract as the CLI path, minus the wrap file and the process launch
+        try:
+            image = AstcencLib.decode(raw_file.read_bytes(), width, height, block_w, block_h)
+            if image is None:
+                return False
+            
+            image.save(output_file, compress_level=CACHE_PNG_COMPRESS_LEVEL)
+            if output_file.stat().st_size > 1000:
+                if cache_key:
+                    ASTCTools.record_decode_config(cache_key, width, height, block_w, block_h, raw_file.stat())
+                return True
+            
+            output_file.unlink()
+            return False
+        except Exception:
+            if output_file.exists():
+                output_file.unlink()
+            return False
+
+    @staticmethod
+    def record_decode_config(cache_key, width, height, block_w, block_h, source_stat):
+        with DECODE_CACHE_LOCK:
+            DECODE_CACHE[cache_key] = {
+                'width': width,
+                'height': height, 
+                'block_w': block_w,
+                'block_h': block_h,
+                'original_size': source_stat.st_size,
+                'mtime_ns': source_stat.st_mtime_ns
+            }
+            DECODE_CACHE_JOURNAL['dirty'].add(cache_key)
+
+    @staticmethod
+    def get_decode_config(cache_key, source_path):
+        # Entries outlive the session, so only trust one recorded from this exact version of
+        # the file; a game update rewrites the texture and changes its size or mtime
+        with DECODE_CACHE_LOCK:
+            cached = DECODE_CACHE.get(cache_key)
+        if not cached:
+            return None
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        if cached.get('original_size') != stat.st_size or cached.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+        return cached
+
+    @staticmethod
+    def decode_first_match(astcenc_path, texture_file, output_path, candidates, cache_key=None):
+        # Candidates run concurrently but keep their sequential priority: the earliest entry
+        # that decodes wins, later ones are cancelled or their output discarded
+        if not candidates:
+            return False
+        
+        outputs = [output_path / name for (_, _, _, _, name) in candidates]
+        winner = None
+        
+        executor = get_worker_pool()
+        futures = [
+            executor.submit(ASTCTools.decode_with_config, astcenc_path, texture_file, output_file, width, height, block_w, block_h)
+            for (width, height, block_w, block_h, _), output_file in zip(candidates, outputs)
+        ]
+        for index, future in enumerate(futures):
+            if future.result():
+                winner = index
+                for pending in futures[index + 1:]:
+                    pending.cancel()
+                break
+        # Losers that already started must finish before their output files are cleaned up
+        concurrent.futures.wait(futures)
+        
+        for index, output_file in enumerate(outputs):
+            if index != winner and output_file.exists():
                 try:
-                    temp_astc.unlink()
-                except:
+                    output_file.unlink()
+                except OSError:
                     pass
+        
+        if winner is None:
+            return False
+        
+        if cache_key:
+            width, height, block_w, block_h, _ = candidates[winner]
+            ASTCTools.record_decode_config(cache_key, width, height, block_w, block_h, texture_file.stat())
+        return True
 
     @staticmethod
     def get_common_block_sizes():
@@ -818,9 +1462,25 @@ class ASTCTools:
             (8, 5), (8, 6), (10, 5), (10, 6), (10, 8)
         ]
 
+    @staticmethod
+    def decode_cached(astcenc_path, texture_file, output_path, cache_key):
+        # A config that already decoded this exact file needs one launch, not a search
+        cached = ASTCTools.get_decode_config(cache_key, texture_file)
+        if not cached:
+            return False
+        
+        output_file = output_path / f"{texture_file.stem}_cached.png"
+        return ASTCTools.decode_with_config(
+            astcenc_path, texture_file, output_file,
+            cached['width'], cached['height'], cached['block_w'], cached['block_h'], cache_key
+        )
+
     @staticmethod
     def decode_with_mapping(astcenc_path, texture_file, output_path, mapping):
         texture_name = texture_file.stem
+        if ASTCTools.decode_cached(astcenc_path, texture_file, output_path, texture_name):
+            return True
+        
         texture_info = ASTCTools.find_texture_info(texture_name, mapping)
         
         if not texture_info:
@@ -831,41 +1491,31 @@ class ASTCTools:
         
         block_sizes = ASTCTools.get_common_block_sizes()
         
-        for block_w, block_h in block_sizes:
-            output_file = output_path / f"{texture_file.stem}.png"
-            
-            if ASTCTools.decode_with_config(astcenc_path, texture_file, output_file, pcvr_width, pcvr_height, block_w, block_h, texture_name):
-                return True
+        # Raw ASTC size is fully determined by dims and block size, so only launch the ones that fit.
+        # Files that don't match any (mipmapped, or Quest dims differing from PCVR) keep the full list.
+        file_size = texture_file.stat().st_size
+        exact = [(bw, bh) for bw, bh in block_sizes if ASTCTools.calculate_astc_size(pcvr_width, pcvr_height, bw, bh) == file_size]
         
-        return False
+        candidates = [
+            (pcvr_width, pcvr_height, block_w, block_h, f"{texture_file.stem}_{block_w}x{block_h}.png")
+            for block_w, block_h in (exact or block_sizes)
+        ]
+        
+        return ASTCTools.decode_first_match(astcenc_path, texture_file, output_path, candidates, texture_name)
 
     @staticmethod
     def brute_force_decode(astcenc_path, texture_file, output_path):
-        configurations = [
-            (2048, 1024, 8, 8, "2Kx1K_8x8"),
-            (2048, 1024, 6, 6, "2Kx1K_6x6"),
-            (2048, 1024, 4, 4, "2Kx1K_4x4"),
-            (1024, 512, 8, 8, "1Kx512_8x8"),
-            (1024, 512, 6, 6, "1Kx512_6x6"),
-            (1024, 512, 4, 4, "1Kx512_4x4"),
-            (2048, 2048, 8, 8, "2K_square_8x8"),
-            (1024, 1024, 8, 8, "1K_square_8x8"),
-        ]
+        if ASTCTools.decode_cached(astcenc_path, texture_file, output_path, texture_file.stem):
+            return True
         
         file_size = texture_file.stat().st_size
         
-        for width, height, block_w, block_h, desc in configurations:
-            expected_size = ASTCTools.calculate_astc_size(width, height, block_w, block_h)
-            
-            if abs(expected_size - file_size) > 100:
-                continue
-                
-            output_file = output_path / f"{texture_file.stem}_BF_{desc}.png"
-            
-            if ASTCTools.decode_with_config(astcenc_path, texture_file, output_file, width, height, block_w, block_h, texture_file.stem):
-                return True
+        candidates = [
+            (width, height, block_w, block_h, f"{texture_file.stem}_BF_{desc}.png")
+            for width, height, block_w, block_h, desc in ASTCTools.BRUTE_FORCE_SIZE_INDEX.get(file_size, [])
+        ]
         
-        return False
+        return ASTCTools.decode_first_match(astcenc_path, texture_file, output_path, candidates, texture_file.stem)
 
     @staticmethod
     def calculate_astc_size(width, height, block_w, block_h):
@@ -877,13 +1527,23 @@ class ASTCTools:
     def pad_to_size(data, target_size):
         current_size = len(data)
         if current_size < target_size:
-            padding = b'\x00' * (target_size - current_size)
-            return data + padding
+            return data.ljust(target_size, b'\x00')
         elif current_size > target_size:
             return data[:target_size]
         else:
             return data
 
+    @staticmethod
+    def pad_file_to_size(file_path, target_size):
+        # Same as pad_to_size, but in place: only the missing tail gets written
+        with open(file_path, 'r+b') as f:
+            current_size = f.seek(0, os.SEEK_END)
+            if current_size < target_size:
+                f.write(b'\x00' * (target_size - current_size))
+            elif current_size > target_size:
+                f.truncate(target_size)
+        return target_size
+
     @staticmethod
     def encode_texture(astcenc_path, input_png, output_file, width, height, block_w, block_h, quality="medium", target_size=None):
         temp_astc = None
@@ -907,17 +1567,17 @@ class ASTCTools:
             with open(temp_astc, 'rb') as f:
                 astc_data = f.read()
             
+            # memoryview so stripping the header doesn't copy the payload
+            raw_data = memoryview(astc_data)
             if len(astc_data) > 16 and astc_data[:4] == b'\x13\xAB\xA1\x5C':
-                raw_data = astc_data[16:]
-            else:
-                raw_data = astc_data
+                raw_data = raw_data[16:]
             
-            if target_size:
-                expected_size = ASTCTools.calculate_astc_size(width, height, block_w, block_h)
-                if len(raw_data) != target_size:
-                    raw_data = ASTCTools.pad_to_size(raw_data, target_size)
+            # Block math is deterministic, so the sizes nearly always match already
+            if target_size and len(raw_data) != target_size:
+                raw_data = ASTCTools.pad_to_size(raw_data.tobytes(), target_size)
             
-            output_file.write_bytes(raw_data)
+            with open(output_file, 'wb') as f:
+                f.write(raw_data)
             return True
             
         except subprocess.TimeoutExpired:
@@ -929,11 +1589,7 @@ class ASTCTools:
                 temp_astc.unlink(missing_ok=True)
 
     @staticmethod
-    def encode_with_cache(astcenc_path, input_png, output_file, texture_name, quality="medium"):
-        if texture_name not in DECODE_CACHE:
-            return False
-        
-        config = DECODE_CACHE[texture_name]
+    def encode_with_cache(astcenc_path, input_png, output_file, config, quality="medium"):
         width = config['width']
         height = config['height']
         block_w = config['block_w']
@@ -944,21 +1600,66 @@ class ASTCTools:
 
     @staticmethod
     def save_decode_cache(cache_file):
+        # Append-only JSONL journal: each save writes just the new or changed entries,
+        # and the file is only rewritten once it holds more than twice as many lines as keys
+        journal_file = Path(cache_file).with_suffix('.jsonl')
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(DECODE_CACHE, f, indent=2)
+            with DECODE_CACHE_LOCK:
+                dirty = DECODE_CACHE_JOURNAL['dirty']
+                lines = [json.dumps({key: DECODE_CACHE[key]}) + '\n' for key in dirty if key in DECODE_CACHE]
+                dirty.clear()
+                total_lines = DECODE_CACHE_JOURNAL['lines'] + len(lines)
+                needs_compaction = DECODE_CACHE_JOURNAL['rewrite'] or total_lines > 2 * len(DECODE_CACHE)
+                if needs_compaction:
+                    lines = [json.dumps({key: config}) + '\n' for key, config in DECODE_CACHE.items()]
+                    total_lines = len(lines)
+                    DECODE_CACHE_JOURNAL['rewrite'] = False
+                DECODE_CACHE_JOURNAL['lines'] = total_lines
+            
+            if needs_compaction:
+                temp_file = journal_file.with_suffix('.jsonl.tmp')
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                os.replace(temp_file, journal_file)
+            elif lines:
+                with open(journal_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(lines))
         except Exception as e:
-            print(f"Cache save error: {e}")
+            logger.warning("Cache save error: %s", e)
 
     @staticmethod
     def load_decode_cache(cache_file):
-        global DECODE_CACHE
-        if os.path.exists(cache_file):
-            try:
+        journal_file = Path(cache_file).with_suffix('.jsonl')
+        loaded = {}
+        line_count = 0
+        torn = False
+        try:
+            if journal_file.exists():
+                with open(journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            loaded.update(json.loads(line)) # last write wins
+                            line_count += 1
+                        except ValueError:
+                            torn = True # tail from an interrupted append
+            elif os.path.exists(cache_file):
+                # Old single-document format; its entries go into the journal on the next save
                 with open(cache_file, 'r', encoding='utf-8') as f:
-                    DECODE_CACHE = json.load(f)
-            except Exception as e:
-                print(f"Cache load error: {e}")
+                    loaded = json.load(f)
+        except Exception as e:
+            logger.warning("Cache load error: %s", e)
+        
+        with DECODE_CACHE_LOCK:
+            DECODE_CACHE.update(loaded)
+            DECODE_CACHE_JOURNAL['lines'] = line_count
+            # A torn line would swallow the next append, so have the next save rewrite the file
+            DECODE_CACHE_JOURNAL['rewrite'] = torn
+            if not line_count:
+                DECODE_CACHE_JOURNAL['dirty'].update(loaded)
+
+ASTCTools.BRUTE_FORCE_SIZE_INDEX = ASTCTools.build_size_index(ASTCTools.BRUTE_FORCE_CONFIGS)
+atexit.register(ASTCTools.remove_wrap_slots)
+atexit.register(ASTCTools.save_decode_cache, DECODE_CACHE_FILE)
 
 class EVRToolsManager:
     def __init__(self):
@@ -1037,24 +1738,66 @@ class DDSHandler:
         83: "DXGI_FORMAT_BC5_UNORM",
     }
     
+    # Block-compressed formats Pillow's "bcn" decoder handles: id -> (bcn variant, mode, pixel format).
+    # sRGB variants share the block layout, the PNG just keeps the stored values. Signed formats
+    # need their pixel format (same names as DdsImagePlugin); BC4_SNORM has none, so texconv gets it.
+    BCN_DXGI = {
+        71: (1, "RGBA", ""), 72: (1, "RGBA", ""),
+        74: (2, "RGBA", ""), 75: (2, "RGBA", ""),
+        77: (3, "RGBA", ""), 78: (3, "RGBA", ""),
+        80: (4, "L", ""),
+        83: (5, "RGB", ""), 84: (5, "RGB", "BC5S"),
+        95: (6, "RGB", "BC6H"), 96: (6, "RGB", "BC6HS"),
+        98: (7, "RGBA", ""), 99: (7, "RGBA", ""),
+    }
+    BCN_FOURCC = {
+        b'DXT1': (1, "RGBA", ""),
+        b'DXT3': (2, "RGBA", ""),
+        b'DXT5': (3, "RGBA", ""),
+        b'ATI1': (4, "L", ""), b'BC4U': (4, "L", ""),
+        b'ATI2': (5, "RGB", ""), b'BC5U': (5, "RGB", ""), b'BC5S': (5, "RGB", "BC5S"),
+    }
+    
+    @staticmethod
+    def has_dds_signature(file_path):
+        # Raw fd read: no buffered file object or 8 KB buffer for a 4-byte check,
+        # and no atime write where the platform lets us skip it
+        try:
+            try:
+                fd = os.open(file_path, SNIFF_OPEN_FLAGS)
+            except PermissionError:
+                # O_NOATIME is only allowed on files we own
+                fd = os.open(file_path, SNIFF_OPEN_FLAGS & ~getattr(os, 'O_NOATIME', 0))
+        except OSError:
+            return False
+        try:
+            return os.read(fd, 4) == b'DDS '
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+
     @staticmethod
     def get_dds_info(file_path):
+        # The same header gets asked for several times per load; reparse only when the file changes
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        info = DDSHandler.read_dds_info(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        return dict(info) if info else None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def read_dds_info(file_path, mtime_ns, file_size):
         try:
             with open(file_path, 'rb') as f:
-                signature = f.read(4)
-                if signature != b'DDS ':
+                # Signature, header and the optional DX10 extension in one read
+                header = f.read(148)
+                if len(header) < 128 or header[:4] != b'DDS ':
                     return None
                 
-                header = f.read(124)
-                if len(header) < 124:
-                    return None
-                
-                height = struct.unpack('<I', header[8:12])[0]
-                width = struct.unpack('<I', header[12:16])[0]
-                mipmap_count = struct.unpack('<I', header[24:28])[0]
-                
-                pixel_format_flags = struct.unpack('<I', header[76:80])[0]
-                four_cc = header[80:84]
+                _, height, width, mipmap_count, pixel_format_flags, four_cc = DDS_HEADER.unpack_from(header)
                 
                 format_name = "Unknown"
                 format_code = None
@@ -1067,9 +1810,8 @@ class DDSHandler:
                 elif four_cc == b'DXT5':
                     format_name = "BC3/DXT5"
                 elif four_cc == b'DX10':
-                    extended_header = f.read(20)
-                    if len(extended_header) >= 20:
-                        format_code = struct.unpack('<I', extended_header[0:4])[0]
+                    if len(header) >= 148:
+                        format_code = DDS_DX10_FORMAT.unpack_from(header, 128)[0]
                         format_name = DDSHandler.DXGI_FORMAT.get(format_code, f"DXGI Format {format_code}")
                         
                         if format_code in [26, 72, 78]:
@@ -1082,7 +1824,7 @@ class DDSHandler:
                     'height': height,
                     'mipmaps': mipmap_count,
                     'format': format_name,
-                    'file_size': os.path.getsize(file_path),
+                    'file_size': file_size,
                     'format_code': format_code,
                     'is_problematic': is_problematic
                 }
@@ -1091,8 +1833,10 @@ class DDSHandler:
             return None
     
     @staticmethod
-    def create_format_preview(width, height, format_name, file_path):
-        img = Image.new('RGB', (max(256, width), max(256, height)), '#1a1a1a')
+    @functools.lru_cache(maxsize=8)
+    def grid_background(width, height):
+        # Placeholders are nearly always the same few sizes; draw each grid once
+        img = Image.new('RGB', (width, height), '#1a1a1a')
         draw = ImageDraw.Draw(img)
         
         grid_size = 32
@@ -1100,6 +1844,12 @@ class DDSHandler:
             draw.line([(x, 0), (x, img.height)], fill='#2a2a2a', width=1)
         for y in range(0, img.height, grid_size):
             draw.line([(0, y), (img.width, y)], fill='#2a2a2a', width=1)
+        return img
+
+    @staticmethod
+    def create_format_preview(width, height, format_name, file_path):
+        img = DDSHandler.grid_background(max(256, width), max(256, height)).copy()
+        draw = ImageDraw.Draw(img)
         
         y_pos = 20
         draw.text((20, y_pos), f"Format: {format_name}", fill='#4cd964')
@@ -1110,12 +1860,189 @@ class DDSHandler:
         
         return img
 
-class TextureLoader:
+class TextureLoader:
+    TEXCONV_BATCH_SIZE = 64
+    _texconv_scratch = queue.LifoQueue()
+    _texconv_scratch_dirs = []
+    _loaded = OrderedDict() # key -> (image, pixel bytes, texture info or None)
+    _loaded_bytes = 0
+    _loaded_lock = threading.Lock()
+    _content_cache = {} # (platform, file size) -> entries for cache PNGs decoded from files of that size
+    _content_lock = threading.Lock()
+    _cache_writes = queue.Queue(maxsize=CACHE_WRITE_QUEUE_SIZE)
+    _pending_cache_writes = set()
+    _pending_cache_lock = threading.Lock()
+
+    @staticmethod
+    def get_memory_key(texture_path, is_quest_texture):
+        # Size and mtime change whenever the file is rewritten, so stale entries never match
+        try:
+            stat = os.stat(texture_path)
+        except OSError:
+            return None
+        return (os.path.abspath(texture_path), stat.st_size, stat.st_mtime_ns, is_quest_texture)
+
+    @staticmethod
+    def get_loaded(key):
+        with TextureLoader._loaded_lock:
+            entry = TextureLoader._loaded.get(key)
+            if entry is None:
+                return None
+            TextureLoader._loaded.move_to_end(key)
+            return entry[0]
+
+    @staticmethod
+    def peek_loaded_texture(texture_path, is_quest_texture=False, preview_size=None):
+        # Memory-only lookup, cheap enough to run on the Tk thread.
+        # Returns (memory key, image, info); image is None on a miss.
+        memory_key = TextureLoader.get_memory_key(texture_path, is_quest_texture)
+        if memory_key is None:
+            return None, None, None
+        memory_key += (preview_size,)
+        with TextureLoader._loaded_lock:
+            entry = TextureLoader._loaded.get(memory_key)
+            if entry is None:
+                return memory_key, None, None
+            TextureLoader._loaded.move_to_end(memory_key)
+            return memory_key, entry[0], entry[2]
+
+    @staticmethod
+    def remember_loaded_info(key, info):
+        # Texture info shown next to the preview, kept with the image so reselecting needs no header reads
+        with TextureLoader._loaded_lock:
+            entry = TextureLoader._loaded.get(key)
+            if entry is not None:
+                TextureLoader._loaded[key] = (entry[0], entry[1], info)
+
+    @staticmethod
+    def remember_loaded(key, img):
+        size = img.width * img.height * len(img.getbands())
+        with TextureLoader._loaded_lock:
+            if key in TextureLoader._loaded:
+                TextureLoader._loaded_bytes -= TextureLoader._loaded[key][1]
+            TextureLoader._loaded[key] = (img, size, None)
+            TextureLoader._loaded.move_to_end(key)
+            TextureLoader._loaded_bytes += size
+            
+            # Count and byte budget both apply; a 4K texture alone is 64 MB of RGBA
+            while len(TextureLoader._loaded) > 1 and (
+                len(TextureLoader._loaded) > LOADED_IMAGE_CACHE_SIZE or TextureLoader._loaded_bytes > LOADED_IMAGE_CACHE_BYTES
+            ):
+                _, evicted = TextureLoader._loaded.popitem(last=False)
+                TextureLoader._loaded_bytes -= evicted[1]
+
+    @staticmethod
+    def is_cached(cache_path):
+        with TextureLoader._pending_cache_lock:
+            if cache_path in TextureLoader._pending_cache_writes:
+                return True
+        return os.path.exists(cache_path)
+
+    @staticmethod
+    def queue_cache_write(img, cache_path):
+        # PNG encoding happens on the cache writer thread so decode workers move straight on.
+        # The copy leaves the caller free to thumbnail its image in place.
+        with TextureLoader._pending_cache_lock:
+            if cache_path in TextureLoader._pending_cache_writes or os.path.exists(cache_path):
+                return
+            TextureLoader._pending_cache_writes.add(cache_path)
+        TextureLoader._cache_writes.put((img.copy(), cache_path))
+
+    @staticmethod
+    def run_cache_writer():
+        while True:
+            img, cache_path = TextureLoader._cache_writes.get()
+            # Written aside and renamed so a reader never opens a half-written PNG
+            temp_path = cache_path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                img.save(temp_path, "PNG", compress_level=CACHE_PNG_COMPRESS_LEVEL)
+                os.replace(temp_path, cache_path)
+            except Exception as e:
+                logger.debug("Cache write failed for %s: %s", cache_path, e)
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            finally:
+                with TextureLoader._pending_cache_lock:
+                    TextureLoader._pending_cache_writes.discard(cache_path)
+                TextureLoader._cache_writes.task_done()
+
+    @staticmethod
+    def get_content_key(texture_path, is_quest_texture):
+        # Many packages ship byte-identical textures under different names
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(b"quest" if is_quest_texture else b"pcvr")
+        with open(texture_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest.update(mm)
+        return digest.digest()
+
+    @staticmethod
+    def get_entry_digest(entry, is_quest_texture):
+        # Entries are hashed lazily, the first time another file of the same size needs comparing
+        if entry['digest'] is None:
+            if os.stat(entry['path']).st_mtime_ns != entry['mtime_ns']:
+                return None # rewritten since it was decoded, so its cache PNG no longer matches
+            entry['digest'] = TextureLoader.get_content_key(entry['path'], is_quest_texture)
+        return entry['digest']
+
+    @staticmethod
+    def reuse_duplicate_preview(texture_path, is_quest_texture, cache_path):
+        # Only files of equal size can be duplicates, so a miss is hashed only when an earlier
+        # texture of that size exists; the rest skip reading the whole file
+        try:
+            stat = os.stat(texture_path)
+        except OSError:
+            return None
+        
+        size_key = (is_quest_texture, stat.st_size)
+        with TextureLoader._content_lock:
+            candidates = list(TextureLoader._content_cache.get(size_key, ()))
+        
+        entry = {'path': texture_path, 'mtime_ns': stat.st_mtime_ns, 'digest': None, 'cache': cache_path}
+        if not candidates:
+            return size_key, entry
+        try:
+            entry['digest'] = TextureLoader.get_content_key(texture_path, is_quest_texture)
+        except OSError:
+            return None
+        
+        for candidate in candidates:
+            try:
+                if TextureLoader.get_entry_digest(candidate, is_quest_texture) != entry['digest']:
+                    continue
+            except OSError:
+                continue
+            if os.path.exists(candidate['cache']):
+                try:
+                    os.link(candidate['cache'], cache_path)
+                except OSError:
+                    try:
+                        fast_copy(candidate['cache'], cache_path)
+                    except OSError:
+                        pass
+                break
+        return size_key, entry
+
+    @staticmethod
+    def remember_content(content_key):
+        size_key, entry = content_key
+        with TextureLoader._content_lock:
+            TextureLoader._content_cache.setdefault(size_key, []).append(entry)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_cache_dir():
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        # Only the path is memoized; writers create the directory, since it can be deleted mid-session
+        return os.path.join(script_dir, CACHE_DIR)
+
     @staticmethod
     def get_cache_path(texture_path):
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        cache_dir = os.path.join(script_dir, CACHE_DIR)
-        os.makedirs(cache_dir, exist_ok=True)
+        cache_dir = TextureLoader.get_cache_dir()
         
         original_name = os.path.basename(texture_path)
         png_name = os.path.splitext(original_name)[0] + ".png"
@@ -1124,23 +2051,51 @@ class TextureLoader:
     
     @staticmethod
     def is_quest_texture_folder(textures_folder):
-        return os.path.basename(textures_folder) == "5231972605540061417"
+        return os.path.basename(textures_folder) == QUEST_TEXTURES_ID
     
     @staticmethod
     def is_pcvr_texture_folder(textures_folder):
-        return os.path.basename(textures_folder) == "-4707359568332879775"
+        return os.path.basename(textures_folder) == PCVR_TEXTURES_ID
     
     @staticmethod
     def get_astcenc_path():
         return get_tool_path("astcenc-avx2.exe")
 
     @staticmethod
-    def load_texture(texture_path, is_quest_texture=False):
+    def warm_astcenc():
+        # First launch of the exe in a session pays the loader + Defender scan; take that hit
+        # at startup rather than on the first texture the user clicks
+        astcenc_path = TextureLoader.get_astcenc_path()
+        if os.path.exists(astcenc_path):
+            try:
+                # Output discarded: only the process launch matters, not the help text
+                run_hidden_command([astcenc_path, "-help"], timeout=5, capture_output=False)
+            except Exception:
+                pass
+
+    @staticmethod
+    def load_texture(texture_path, is_quest_texture=False, preview_size=None):
         try:
+            memory_key = TextureLoader.get_memory_key(texture_path, is_quest_texture)
+            if memory_key:
+                memory_key += (preview_size,)
+                img = TextureLoader.get_loaded(memory_key)
+                if img is not None:
+                    return img
+            
             cache_path = TextureLoader.get_cache_path(texture_path)
+            content_key = None
+            if not os.path.exists(cache_path):
+                content_key = TextureLoader.reuse_duplicate_preview(texture_path, is_quest_texture, cache_path)
+            
             if os.path.exists(cache_path):
                 try:
-                    img = Image.open(cache_path).convert("RGBA")
+                    if preview_size:
+                        img = TextureLoader.open_preview(cache_path, preview_size)
+                    else:
+                        img = Image.open(cache_path).convert("RGBA")
+                    if memory_key:
+                        TextureLoader.remember_loaded(memory_key, img)
                     return img
                 except Exception as e:
                     try:
@@ -1149,13 +2104,37 @@ class TextureLoader:
                         pass
             
             if is_quest_texture:
-                return TextureLoader.load_quest_texture(texture_path, cache_path)
+                img = TextureLoader.load_quest_texture(texture_path, cache_path)
             else:
-                return TextureLoader.load_dds_texture(texture_path, cache_path)
+                img = TextureLoader.load_dds_texture(texture_path, cache_path)
+            
+            if preview_size and img is not None:
+                img.thumbnail(preview_size, Image.Resampling.LANCZOS, reducing_gap=PREVIEW_REDUCING_GAP)
+            
+            # Only real decodes land in the disk cache; error placeholders should be retried next time
+            if img is not None and TextureLoader.is_cached(cache_path):
+                if content_key:
+                    TextureLoader.remember_content(content_key)
+                if memory_key:
+                    TextureLoader.remember_loaded(memory_key, img)
+            return img
 
         except Exception as e:
             return DDSHandler.create_format_preview(256, 256, "Error Loading", texture_path)
 
+    @staticmethod
+    def open_preview(image_path, preview_size):
+        # Shrink while decoding instead of after: draft() lets JPEG skip most of the IDCT
+        # (no-op for other formats), and thumbnail() resizes in place, box-reducing by an
+        # integer factor first through reducing_gap
+        img = Image.open(image_path)
+        img.draft("RGB", preview_size)
+        if img.mode not in ("RGB", "RGBA", "L", "LA"):
+            img = img.convert("RGBA")
+        
+        img.thumbnail(preview_size, Image.Resampling.LANCZOS, reducing_gap=PREVIEW_REDUCING_GAP)
+        return img if img.mode == "RGBA" else img.convert("RGBA")
+
     @staticmethod
     def load_quest_texture(texture_path, cache_path):
         try:
@@ -1182,10 +2161,13 @@ class TextureLoader:
                 png_files = list(output_path.glob("*.png"))
                 if png_files:
                     img = Image.open(png_files[0]).convert("RGBA")
-                    try:
-                        img.save(cache_path)
-                    except Exception as e:
-                        pass
+                    # astcenc already wrote an RGBA PNG, so move it into the cache instead of encoding it again
+                    if not os.path.exists(cache_path):
+                        try:
+                            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                            shutil.move(str(png_files[0]), cache_path)
+                        except Exception as e:
+                            pass
                     
                     shutil.rmtree(temp_dir, ignore_errors=True)
                     return img
@@ -1200,163 +2182,271 @@ class TextureLoader:
     def load_dds_texture(dds_path, cache_path):
         dds_info = DDSHandler.get_dds_info(dds_path)
 
-        if dds_info and dds_info.get("is_problematic", False):
-            return TextureLoader.load_with_texconv(dds_path, cache_path)
+        if not (dds_info and dds_info.get("is_problematic", False)):
+            try:
+                img = Image.open(dds_path)
+                if img:
+                    TextureLoader.queue_cache_write(img, cache_path)
+                    return img
+            except Exception as e:
+                pass
 
-        try:
-            img = Image.open(dds_path)
-            if img:
-                try:
-                    img.save(cache_path)
-                except Exception as e:
-                    pass
-                return img
-        except Exception as e:
-            pass
+        # Formats the DDS plugin rejects (sRGB variants etc.) are often still plain BCn blocks;
+        # decode those directly and keep texconv for what's left
+        img = TextureLoader.decode_bc_in_process(dds_path)
+        if img is not None:
+            TextureLoader.queue_cache_write(img, cache_path)
+            return img
 
         return TextureLoader.load_with_texconv(dds_path, cache_path)
 
     @staticmethod
-    def load_with_texconv(dds_path, cache_path=None):
-        import struct
+    def decode_bc_in_process(dds_path):
+        try:
+            with open(dds_path, 'rb') as f:
+                header = f.read(148)
+                if len(header) < 128 or header[:4] != b'DDS ':
+                    return None
+                
+                _, height, width, _, _, four_cc = DDS_HEADER.unpack_from(header)
+                if four_cc == b'DX10':
+                    if len(header) < 148:
+                        return None
+                    bcn = DDSHandler.BCN_DXGI.get(DDS_DX10_FORMAT.unpack_from(header, 128)[0])
+                    data_offset = 148
+                else:
+                    bcn = DDSHandler.BCN_FOURCC.get(four_cc)
+                    data_offset = 128
+                
+                if not bcn or not width or not height:
+                    return None
+                
+                # Top mip only
+                variant, mode, pixel_format = bcn
+                block_bytes = 8 if variant in (1, 4) else 16
+                top_size = ((width + 3) // 4) * ((height + 3) // 4) * block_bytes
+                f.seek(data_offset)
+                data = f.read(top_size)
+                if len(data) < top_size:
+                    return None
+            
+            return Image.frombytes(mode, (width, height), data, "bcn", variant, pixel_format)
+        except Exception:
+            return None
 
-        temp_input = None
-        temp_dir = None
+    @staticmethod
+    def load_with_texconv(dds_path, cache_path=None):
+        return TextureLoader.load_batch_with_texconv([dds_path], [cache_path])[0]
 
-        try:
-            texconv_path = get_tool_path("texconv.exe")
+    @staticmethod
+    def prepare_texconv_input(dds_path, temp_input):
+        dds_info = DDSHandler.get_dds_info(dds_path)
 
-            if not os.path.exists(texconv_path):
-                return DDSHandler.create_format_preview(256, 256, "Missing texconv.exe", dds_path)
+        # Only the magic is needed up front; the payload is streamed, never held in memory
+        with open(dds_path, "rb") as f:
+            is_dds = f.read(4) == b"DDS "
 
-            with open(dds_path, "rb") as f:
-                raw_data = f.read()
+        if is_dds:
+            fast_copy(dds_path, temp_input)
+        else:
+            width = dds_info.get("width", 256)
+            height = dds_info.get("height", 256)
+
+            format_code = dds_info.get("format_code") or next(
+                (code for name, code in TEXCONV_FORMAT_CODES if name in dds_info.get("format", "")), 71
+            )
+
+            header = bytearray(DDS_DX10_FILE_HEADER.size)
+            DDS_DX10_FILE_HEADER.pack_into(
+                header, 0,
+                b"DDS ", 124, 0x0002100F, height, width, 0, 0, 1,
+                32, 4, b"DX10", 0, 0, 0, 0, 0,
+                0x1000, 0, 0, 0, 0,
+                format_code, 3, 0, 1, 0
+            )
+
+            with open(dds_path, "rb") as f, open(temp_input, "wb") as out:
+                out.write(header)
+                shutil.copyfileobj(f, out)
+
+        if dds_info and dds_info.get("format_code") == 26:
+            return "R16G16B16A16_FLOAT"
+        return None
 
-            is_dds = raw_data[:4] == b"DDS "
+    @staticmethod
+    def needs_texconv(dds_path):
+        # Same order as load_dds_texture: Pillow's DDS plugin, then the in-process BCn decoder.
+        # Image.open only parses the header, so this stays cheap enough to run over a folder.
+        dds_info = DDSHandler.get_dds_info(dds_path)
+        if not dds_info:
+            return False
+        if dds_info.get('format_code') in DDSHandler.BCN_DXGI:
+            return False
+        if not dds_info.get('is_problematic', False):
+            try:
+                with Image.open(dds_path):
+                    return False
+            except Exception:
+                pass
+        return True
 
-            temp_input = tempfile.NamedTemporaryFile(suffix=".dds", delete=False)
-            temp_input.close()
+    @staticmethod
+    def precache_texconv_previews(dds_paths, should_continue):
+        # Folder preload: textures only texconv can decode are converted ahead of time, up to
+        # TEXCONV_BATCH_SIZE per texconv launch, so selecting them later is a cache hit.
+        # Returns how many were converted.
+        if not os.path.exists(get_tool_path("texconv.exe")):
+            return 0
+        
+        pending = []
+        for dds_path in dds_paths:
+            if not should_continue():
+                return 0
+            if not TextureLoader.is_cached(TextureLoader.get_cache_path(dds_path)) and TextureLoader.needs_texconv(dds_path):
+                pending.append(dds_path)
+        
+        converted = 0
+        for offset in range(0, len(pending), TextureLoader.TEXCONV_BATCH_SIZE):
+            if not should_continue():
+                break
+            batch = pending[offset:offset + TextureLoader.TEXCONV_BATCH_SIZE]
+            TextureLoader.load_batch_with_texconv(batch, [TextureLoader.get_cache_path(path) for path in batch], keep_images=False)
+            converted += len(batch)
+        return converted
 
-            if is_dds:
-                shutil.copy(dds_path, temp_input.name)
-            else:
-                dds_info = DDSHandler.get_dds_info(dds_path)
-                width = dds_info.get("width", 256)
-                height = dds_info.get("height", 256)
-
-                format_code = 71  
-                fmt_str = dds_info.get("format", "")
-
-                if "DXGI_FORMAT_BC1" in fmt_str:
-                    format_code = 71
-                elif "DXGI_FORMAT_BC3" in fmt_str:
-                    format_code = 77
-                elif "DXGI_FORMAT_BC4" in fmt_str:
-                    format_code = 80
-                elif "DXGI_FORMAT_BC5" in fmt_str:
-                    format_code = 83
-                elif "DXGI_FORMAT_R11G11B10_FLOAT" in fmt_str:
-                    format_code = 26
-
-                header = b"DDS "                                  
-                header += struct.pack("<I", 124)                  
-                header += struct.pack("<I", 0x0002100F)           
-                header += struct.pack("<I", height)               
-                header += struct.pack("<I", width)                
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 1)                    
-                header += b"\x00" * (11 * 4)                      
-
-                header += struct.pack("<I", 32)                   
-                header += struct.pack("<I", 4)                    
-                header += b"DX10"                                 
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-
-                header += struct.pack("<I", 0x1000)               
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-                header += struct.pack("<I", 0)                    
-
-                dx10_header = struct.pack("<I", format_code)      
-                dx10_header += struct.pack("<I", 3)               
-                dx10_header += struct.pack("<I", 0)               
-                dx10_header += struct.pack("<I", 1)               
-                dx10_header += struct.pack("<I", 0)               
-
-                with open(temp_input.name, "wb") as out:
-                    out.write(header)
-                    out.write(dx10_header)
-                    out.write(raw_data)
-
-            dds_info = DDSHandler.get_dds_info(dds_path)
-            force_format = None
-            if dds_info and "DXGI_FORMAT_R11G11B10_FLOAT" in dds_info.get("format", ""):
-                force_format = "R16G16B16A16_FLOAT"
-
-            temp_dir = tempfile.mkdtemp(prefix="texconv_")
-            cmd = [
-                texconv_path,
-                "-ft", "png",
-                "-o", temp_dir,
-                "-y"
-            ]
-            if force_format:
-                cmd.extend(["-f", force_format])
-            cmd.append(temp_input.name)
+    @staticmethod
+    def load_batch_with_texconv(dds_paths, cache_paths, keep_images=True):
+        # texconv takes many inputs per launch, so convert everything that shares the same
+        # -f option in one process instead of paying texconv's startup once per file.
+        # Without keep_images only the cache files are produced and the results are None.
+        texconv_path = get_tool_path("texconv.exe")
+        if not os.path.exists(texconv_path):
+            return [DDSHandler.create_format_preview(256, 256, "Missing texconv.exe", path) for path in dds_paths]
+        
+        results = [None] * len(dds_paths)
+        with TextureLoader.texconv_scratch() as (input_dir, output_dir):
+            groups = {}
+            for index, dds_path in enumerate(dds_paths):
+                temp_input = os.path.join(input_dir, f"{index}.dds")
+                try:
+                    force_format = TextureLoader.prepare_texconv_input(dds_path, temp_input)
+                except Exception:
+                    results[index] = DDSHandler.create_format_preview(256, 256, "texconv error", dds_path)
+                    continue
+                groups.setdefault(force_format, []).append((index, temp_input))
+            
+            for force_format, members in groups.items():
+                # Chunked so the command line stays well under the Windows length limit
+                for offset in range(0, len(members), TextureLoader.TEXCONV_BATCH_SIZE):
+                    batch = members[offset:offset + TextureLoader.TEXCONV_BATCH_SIZE]
+                    cmd = [
+                        texconv_path,
+                        "-ft", "png",
+                        "-o", output_dir,
+                        "-y",
+                        "-nologo",
+                        "-singleproc" # parallelism, if any, belongs to the caller; don't oversubscribe cores
+                    ]
+                    # No -gpu here: texconv only uses DirectCompute when compressing to BC6H/BC7,
+                    # decoding any BC format to PNG always runs on the CPU
+                    if force_format:
+                        cmd.extend(["-f", force_format])
+                    cmd.extend(temp_input for _, temp_input in batch)
+                    
+                    result = run_hidden_command(cmd)
+                    
+                    for index, temp_input in batch:
+                        if keep_images:
+                            results[index] = TextureLoader.collect_texconv_output(
+                                output_dir, temp_input, dds_paths[index], cache_paths[index], result.returncode
+                            )
+                        else:
+                            TextureLoader.move_texconv_output(output_dir, temp_input, cache_paths[index])
+            
+            return results
 
-            result = run_hidden_command(cmd)
+    @staticmethod
+    @contextlib.contextmanager
+    def texconv_scratch():
+        # Scratch in/out dirs live for the whole session instead of a mkdtemp + rmtree per load.
+        # Each concurrent batch checks one pair out. Input files (0.dds, 1.dds, ...) are kept and
+        # simply rewritten by the next batch; outputs are cleared since their presence means success.
+        try:
+            scratch_dir = TextureLoader._texconv_scratch.get_nowait()
+        except queue.Empty:
+            scratch_dir = tempfile.mkdtemp(prefix="texconv_")
+            TextureLoader._texconv_scratch_dirs.append(scratch_dir)
+        
+        input_dir = os.path.join(scratch_dir, "in")
+        output_dir = os.path.join(scratch_dir, "out")
+        # Recreated if a temp cleaner removed them mid-session
+        os.makedirs(input_dir, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            yield input_dir, output_dir
+        finally:
+            try:
+                with os.scandir(output_dir) as it:
+                    for entry in it:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            TextureLoader._texconv_scratch.put(scratch_dir)
 
-            if result.returncode != 0:
-                return DDSHandler.create_format_preview(256, 256, "texconv error", dds_path)
+    @staticmethod
+    def remove_texconv_scratch():
+        for scratch_dir in TextureLoader._texconv_scratch_dirs:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
 
-            base = os.path.splitext(os.path.basename(temp_input.name))[0]
-            converted_file = os.path.join(temp_dir, base + ".png")
-            if os.path.exists(converted_file):
-                img = Image.open(converted_file).convert("RGBA")
-                
-                if cache_path:
-                    try:
-                        img.save(cache_path)
-                    except Exception as e:
-                        pass
-                
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                return img
-            else:
-                return DDSHandler.create_format_preview(256, 256, "texconv failed", dds_path)
+    @staticmethod
+    def move_texconv_output(output_dir, temp_input, cache_path):
+        # texconv already wrote a PNG; when nobody needs the image now, that file is the cache entry
+        base = os.path.splitext(os.path.basename(temp_input))[0]
+        converted_file = os.path.join(output_dir, base + ".png")
+        if os.path.exists(converted_file):
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                shutil.move(converted_file, cache_path)
+            except OSError as e:
+                logger.debug("Could not move texconv output to %s: %s", cache_path, e)
 
-        except Exception as e:
+    @staticmethod
+    def collect_texconv_output(output_dir, temp_input, dds_path, cache_path, returncode):
+        # texconv exits non-zero if any input in the batch failed, so judge each file by its output
+        base = os.path.splitext(os.path.basename(temp_input))[0]
+        converted_file = os.path.join(output_dir, base + ".png")
+        if not os.path.exists(converted_file):
+            message = "texconv error" if returncode != 0 else "texconv failed"
+            return DDSHandler.create_format_preview(256, 256, message, dds_path)
+        
+        try:
+            # Read it into memory in one go so the scratch file is closed and free to delete
+            with open(converted_file, 'rb') as f:
+                img = Image.open(io.BytesIO(f.read())).convert("RGBA")
+        except Exception:
             return DDSHandler.create_format_preview(256, 256, "texconv error", dds_path)
-        finally:
-            if temp_input and os.path.exists(temp_input.name):
-                try:
-                    os.remove(temp_input.name)
-                except Exception:
-                    pass
-            
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        if cache_path:
+            TextureLoader.queue_cache_write(img, cache_path)
+        return img
+
+atexit.register(TextureLoader.remove_texconv_scratch)
+threading.Thread(target=TextureLoader.run_cache_writer, daemon=True).start()
+# Let queued cache writes land before the interpreter goes away
+atexit.register(TextureLoader._cache_writes.join)
 
 class TextureReplacer:
     @staticmethod
     def hex_edit_file_size(file_path, new_size):
         try:
             with open(file_path, 'r+b') as f:
-                data = bytearray(f.read())
-                
-                if len(data) >= 248:
-                    file_size_bytes = struct.pack('<I', new_size)
-                    data[244:248] = file_size_bytes
-                    
-                    f.seek(0)
-                    f.write(data)
-                    f.truncate()
+                # Only the 4-byte field changes, so patch it in place rather than rewriting the file
+                if os.fstat(f.fileno()).st_size >= CORRESPONDING_SIZE_OFFSET + CORRESPONDING_SIZE.size:
+                    f.seek(CORRESPONDING_SIZE_OFFSET)
+                    f.write(CORRESPONDING_SIZE.pack(new_size))
                     
                     return True
                 else:
@@ -1368,22 +2458,22 @@ class TextureReplacer:
     @staticmethod
     def replace_pcvr_texture(output_folder, pcvr_input_folder, original_texture_path, replacement_texture_path, replacement_size):
         try:
-            input_textures_folder = os.path.join(pcvr_input_folder, "0", "-4707359568332879775")
-            input_corresponding_folder = os.path.join(pcvr_input_folder, "0", "5353709876897953952")
+            input_textures_folder = os.path.join(pcvr_input_folder, "0", PCVR_TEXTURES_ID)
+            input_corresponding_folder = os.path.join(pcvr_input_folder, "0", PCVR_CORRESPONDING_ID)
             
             os.makedirs(input_textures_folder, exist_ok=True)
             os.makedirs(input_corresponding_folder, exist_ok=True)
             
             texture_name = os.path.basename(original_texture_path)
-            output_corresponding_file = os.path.join(output_folder, "5353709876897953952", texture_name)
+            output_corresponding_file = os.path.join(output_folder, PCVR_CORRESPONDING_ID, texture_name)
             
             input_texture_path = os.path.join(input_textures_folder, texture_name)
             input_corresponding_path = os.path.join(input_corresponding_folder, texture_name)
             
-            shutil.copy2(replacement_texture_path, input_texture_path)
+            fast_copy(replacement_texture_path, input_texture_path)
             
             if os.path.exists(output_corresponding_file):
-                shutil.copy2(output_corresponding_file, input_corresponding_path)
+                fast_copy(output_corresponding_file, input_corresponding_path)
                 
                 success = TextureReplacer.hex_edit_file_size(input_corresponding_path, replacement_size)
                 
@@ -1400,8 +2490,8 @@ class TextureReplacer:
     @staticmethod
     def replace_quest_texture(output_folder, quest_input_folder, original_texture_path, replacement_texture_path, texture_cache):
         try:
-            input_textures_folder = os.path.join(quest_input_folder, "0", "5231972605540061417")
-            input_corresponding_folder = os.path.join(quest_input_folder, "0", "-2094201140079393352")
+            input_textures_folder = os.path.join(quest_input_folder, "0", QUEST_TEXTURES_ID)
+            input_corresponding_folder = os.path.join(quest_input_folder, "0", QUEST_CORRESPONDING_ID)
             
             os.makedirs(input_textures_folder, exist_ok=True)
             os.makedirs(input_corresponding_folder, exist_ok=True)
@@ -1418,15 +2508,18 @@ class TextureReplacer:
             if os.path.exists(MAPPING_FILE):
                 mapping = ASTCTools.load_texture_mapping(MAPPING_FILE)
             
-            temp_output = os.path.join(tempfile.gettempdir(), f"encoded_{texture_name}")
+            # encode_texture only writes its output once astcenc succeeded, so encode straight
+            # into the input folder instead of going through a temp file
+            input_texture_path = os.path.join(input_textures_folder, texture_name)
             texture_name_no_ext = os.path.splitext(texture_name)[0]
             
             success = False
             
-            if texture_name_no_ext in DECODE_CACHE:
-                success = ASTCTools.encode_with_cache(astcenc_path, Path(replacement_texture_path), Path(temp_output), texture_name_no_ext, "medium")
+            decode_config = ASTCTools.get_decode_config(texture_name_no_ext, original_texture_path)
+            if decode_config:
+                success = ASTCTools.encode_with_cache(astcenc_path, Path(replacement_texture_path), Path(input_texture_path), decode_config, "medium")
             elif mapping:
-                success = ASTCTools.encode_texture(astcenc_path, Path(replacement_texture_path), Path(temp_output), 
+                success = ASTCTools.encode_texture(astcenc_path, Path(replacement_texture_path), Path(input_texture_path), 
                                                  mapping[texture_name_no_ext]['width'], 
                                                  mapping[texture_name_no_ext]['height'], 
                                                  8, 8, "medium", original_size)
@@ -1436,40 +2529,20 @@ class TextureReplacer:
             if not success:
                 return False, "Failed to encode texture"
             
-            encoded_size = os.path.getsize(temp_output)
-            if encoded_size != original_size:
-                with open(temp_output, 'rb') as f:
-                    encoded_data = f.read()
-                
-                padded_data = ASTCTools.pad_to_size(encoded_data, original_size)
-                with open(temp_output, 'wb') as f:
-                    f.write(padded_data)
-            
-            input_texture_path = os.path.join(input_textures_folder, texture_name)
-            shutil.copy2(temp_output, input_texture_path)
-            
-            final_size = os.path.getsize(temp_output)
+            final_size = ASTCTools.pad_file_to_size(input_texture_path, original_size)
             
-            output_corresponding_file = os.path.join(output_folder, "-2094201140079393352", texture_name)
+            output_corresponding_file = os.path.join(output_folder, QUEST_CORRESPONDING_ID, texture_name)
             if os.path.exists(output_corresponding_file):
                 input_corresponding_path = os.path.join(input_corresponding_folder, texture_name)
-                shutil.copy2(output_corresponding_file, input_corresponding_path)
+                fast_copy(output_corresponding_file, input_corresponding_path)
                 
                 success = TextureReplacer.hex_edit_file_size(input_corresponding_path, final_size)
                 
                 if success:
-                    try:
-                        os.remove(temp_output)
-                    except:
-                        pass
                     return True, f"Quest texture replaced. Size updated to {final_size} bytes."
                 else:
                     return False, "Failed to update file size"
             else:
-                try:
-                    os.remove(temp_output)
-                except:
-                    pass
                 return True, ("Quest texture replaced (no corresponding file)")
                 
         except Exception as e:
@@ -1500,6 +2573,8 @@ class EchoVRTextureViewer:
         self.root.configure(bg=self.colors['bg_dark'])
         
         self.config = ConfigManager.load_config()
+        # Block sizes found by earlier sessions, so known textures skip the brute-force search
+        ASTCTools.load_decode_cache(DECODE_CACHE_FILE)
         self.output_folder = self.config.get('output_folder')
         self.pcvr_input_folder = self.config.get('pcvr_input_folder')
         self.quest_input_folder = self.config.get('quest_input_folder')
@@ -1523,11 +2598,36 @@ class EchoVRTextureViewer:
         self.is_quest_textures = False
         self.is_pcvr_textures = False
         
-        self.texture_cache = {}
+        self.texture_cache = set()
+        self._texture_cache_files = {} # cache.json path -> (mtime_ns, names), reused until the file changes
         self.all_textures = []
+        self.all_textures_lower = []
         self.filtered_textures = []
+        self.filtered_textures_lower = []
+        self._filter_query = ""
+        self._filter_job = None
         
         self.is_downloading = False
+        self._app_path = get_base_dir()
+        self._extract_path = os.path.join(self._app_path, "_internal")
+        self._temp_zip = os.path.join(tempfile.gettempdir(), "texture_cache.zip")
+        self._http = DownloadSession(DOWNLOAD_HEADERS)
+        
+        # Worker threads post log lines here; drained on the Tk thread in one pass
+        self._log_q = queue.Queue()
+        # Single pending after id for the drain, so an idle app schedules nothing
+        self._log_drain_id = None
+        self._log_drain_lock = threading.Lock()
+        self._log_scroll_pending = False
+        # (id(image), canvas size) -> (weakref to image, PhotoImage, (size, mode))
+        self._photo_cache = OrderedDict()
+        # (path, mtime, size, platform, preview size) -> decoded replacement image
+        self._replacement_cache = OrderedDict()
+        # Texture selections waiting for the decode worker; only the newest one is decoded
+        self._decode_queue = queue.Queue()
+        # Bumped per loaded folder so a running texconv preload stops once the folder changes
+        self._precache_generation = 0
+        threading.Thread(target=self._decode_worker, daemon=True).start()
         
         self.setup_ui()
         self.auto_detect_folders()
@@ -1540,6 +2640,9 @@ class EchoVRTextureViewer:
             
         if self.extracted_folder and os.path.exists(self.extracted_folder):
             self.set_extracted_folder(self.extracted_folder)
+        
+        if sys.platform == 'win32':
+            threading.Thread(target=TextureLoader.warm_astcenc, daemon=True).start()
     
     def auto_detect_folders(self):
         if getattr(sys, 'frozen', False):
@@ -1659,7 +2762,7 @@ class EchoVRTextureViewer:
         self.search_var = tk.StringVar()
         self.search_entry = tk.Entry(search_frame, textvariable=self.search_var, bg=self.colors['bg_light'], fg=self.colors['text_light'], font=("Arial", 9), insertbackground=self.colors['text_light'])
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        self.search_entry.bind('<KeyRelease>', self.filter_textures)
+        self.search_entry.bind('<KeyRelease>', self.schedule_filter)
         
         clear_btn = tk.Button(search_frame, text="X", command=self.clear_search, bg=self.colors['bg_light'], fg=self.colors['text_light'], font=("Arial", 9), relief=tk.RAISED, bd=1, width=3)
         clear_btn.pack(side=tk.LEFT)
@@ -1669,7 +2772,10 @@ class EchoVRTextureViewer:
         list_frame.columnconfigure(0, weight=1)
         list_frame.rowconfigure(0, weight=1)
         
-        self.file_list = tk.Listbox(list_frame, bg=self.colors['bg_light'], fg=self.colors['text_light'], selectbackground=self.colors['accent_green'], selectforeground=self.colors['text_light'], font=("Arial", 9), relief=tk.SUNKEN, bd=1)
+        # The Listbox only draws its visible rows; its items come from this Tcl list variable,
+        # so replacing the whole list is a single variable set
+        self.file_list_var = tk.Variable(value=())
+        self.file_list = tk.Listbox(list_frame, listvariable=self.file_list_var, bg=self.colors['bg_light'], fg=self.colors['text_light'], selectbackground=self.colors['accent_green'], selectforeground=self.colors['text_light'], font=("Arial", 9), relief=tk.SUNKEN, bd=1)
         
         scrollbar = tk.Scrollbar(list_frame, bg=self.colors['bg_light'])
         self.file_list.configure(yscrollcommand=scrollbar.set)
@@ -1746,8 +2852,37 @@ class EchoVRTextureViewer:
     
     def log_info(self, message):
         self.info_text.insert(tk.END, message + "\n")
+        # Scroll once per burst of lines, when Tk goes idle, instead of forcing a redraw per line
+        if not self._log_scroll_pending:
+            self._log_scroll_pending = True
+            self.root.after_idle(self._scroll_log)
+    
+    def _scroll_log(self):
+        self._log_scroll_pending = False
         self.info_text.see(tk.END)
-        self.info_text.update_idletasks()
+    
+    def post_log(self, message):
+        # Safe from any thread; lines posted within 50 ms of each other share one drain
+        self._log_q.put(message)
+        with self._log_drain_lock:
+            if self._log_drain_id is None:
+                self._log_drain_id = self.root.after(50, self._drain_log_queue)
+    
+    def _flush_log_queue(self):
+        messages = []
+        while True:
+            try:
+                messages.append(self._log_q.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            self.log_info("\n".join(messages))
+    
+    def _drain_log_queue(self):
+        # Cleared before flushing so a line posted mid-flush schedules the next drain
+        with self._log_drain_lock:
+            self._log_drain_id = None
+        self._flush_log_queue()
     
     def select_data_folder(self):
         path = filedialog.askdirectory(title="Select Data Folder (contains manifests and packages)")
@@ -1800,14 +2935,19 @@ class EchoVRTextureViewer:
     def populate_package_dropdown(self, manifests_path):
         try:
             packages = []
-            for file_name in os.listdir(manifests_path):
-                if os.path.isfile(os.path.join(manifests_path, file_name)):
-                    packages_path = os.path.join(os.path.dirname(manifests_path), "packages")
-                    package_file = os.path.join(packages_path, file_name)
-                    package_file_0 = os.path.join(packages_path, f"{file_name}_0")
-                    
-                    if os.path.exists(package_file) or os.path.exists(package_file_0):
-                        packages.append(file_name)
+            # List the packages folder once and look names up in it, instead of two stats per manifest
+            packages_path = os.path.join(os.path.dirname(manifests_path), "packages")
+            try:
+                package_files = set(os.listdir(packages_path))
+            except OSError:
+                package_files = set()
+            
+            with os.scandir(manifests_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        file_name = entry.name
+                        if file_name in package_files or f"{file_name}_0" in package_files:
+                            packages.append(file_name)
             
             filtered_packages = [pkg for pkg in packages if pkg == "48037dc70b0ecab2"]
             if not filtered_packages and packages:
@@ -1884,18 +3024,19 @@ class EchoVRTextureViewer:
         self.root.update_idletasks()
         
         def extraction_thread():
+            # evrFileTools does the work in its own process; this thread only waits on it.
+            # Searching the extracted tree happens here too, so the Tk thread never walks it.
             success, message = self.evr_tools.extract_package(self.data_folder, self.package_name, self.extracted_folder, textures_only=textures_only)
-            self.root.after(0, lambda: self.on_extraction_complete(success, message))
+            textures_path = self.find_extracted_textures(self.extracted_folder) if success else None
+            self.root.after(0, self.on_extraction_complete, success, message, textures_path)
         
         threading.Thread(target=extraction_thread, daemon=True).start()
     
-    def on_extraction_complete(self, success, message):
+    def on_extraction_complete(self, success, message, extracted_textures_path=None):
         if success:
             self.evr_status_label.config(text="Extraction successful!", fg=self.colors['success'])
             self.log_info(f"✓ EXTRACTION: {message}")
             
-            extracted_textures_path = self.find_extracted_textures(self.extracted_folder)
-            
             if extracted_textures_path:
                 self.set_output_folder(extracted_textures_path)
             else:
@@ -1908,15 +3049,13 @@ class EchoVRTextureViewer:
             messagebox.showerror("Extraction Error", message)
     
     def find_extracted_textures(self, base_dir):
-        texture_patterns = [
-            os.path.join(base_dir, "**", "-4707359568332879775"),
-            os.path.join(base_dir, "**", "5231972605540061417"),
-        ]
+        texture_folders = FOLDER_LAYOUTS.keys()
         
-        for pattern in glob.glob(os.path.join(base_dir, "**"), recursive=True):
-             if os.path.basename(pattern) in ["-4707359568332879775", "5231972605540061417"]:
-                 if os.path.isdir(pattern):
-                     return os.path.dirname(pattern)
+        # One top-down walk that stops at the first texture folder; os.walk already knows which
+        # entries are directories, so nothing gets stat'ed again
+        for root, dirs, _ in os.walk(base_dir):
+            if not texture_folders.isdisjoint(dirs):
+                return root
         
         return None
     
@@ -1947,7 +3086,7 @@ class EchoVRTextureViewer:
         
         def repacking_thread():
             success, message = self.evr_tools.repack_package(output_dir, self.package_name, self.data_folder, input_folder)
-            self.root.after(0, lambda: self.on_repacking_complete(success, message, output_dir))
+            self.root.after(0, self.on_repacking_complete, success, message, output_dir)
         
         threading.Thread(target=repacking_thread, daemon=True).start()
     
@@ -1975,7 +3114,7 @@ class EchoVRTextureViewer:
         self.log_info("Installing ADB Platform Tools...")
         def install_thread():
             success, message = ADBManager.install_adb_tools()
-            self.root.after(0, lambda: self.on_adb_install_complete(success, message))
+            self.root.after(0, self.on_adb_install_complete, success, message)
         threading.Thread(target=install_thread, daemon=True).start()
     
     def on_adb_install_complete(self, success, message):
@@ -1987,10 +3126,10 @@ class EchoVRTextureViewer:
             self.log_info(f"❌ ADB installation failed: {message}")
             messagebox.showerror("Error", f"ADB installation failed: {message}")
     
-    def test_adb_connection(self):
+    def test_adb_connection(self, use_cache=False):
         def test_thread():
-            success, message, adb_path = ADBManager.check_adb()
-            self.root.after(0, lambda: self.on_adb_test_complete(success, message))
+            success, message, adb_path = ADBManager.check_adb(use_cache)
+            self.root.after(0, self.on_adb_test_complete, success, message)
         threading.Thread(target=test_thread, daemon=True).start()
     
     def on_adb_test_complete(self, success, message):
@@ -2004,7 +3143,7 @@ class EchoVRTextureViewer:
     
     def update_quest_push_button(self):
         if self.is_quest_textures and self.output_folder:
-            self.test_adb_connection()
+            self.test_adb_connection(use_cache=True)
         else:
             self.push_quest_btn.config(state=tk.DISABLED, bg=self.colors['bg_light'])
     
@@ -2033,20 +3172,20 @@ class EchoVRTextureViewer:
                 if self.repacked_folder and os.path.exists(self.repacked_folder):
                     if (os.path.exists(os.path.join(self.repacked_folder, "manifests")) or os.path.exists(os.path.join(self.repacked_folder, "packages"))):
                         push_folder = self.repacked_folder
-                        self.log_info("📦 Using repacked folder")
+                        self.post_log("📦 Using repacked folder")
                 
                 quest_dest_path = "/sdcard/readyatdawn/files/_data/5932408047/rad15/android"
                 
                 success, message = ADBManager.push_to_quest(push_folder, quest_dest_path)
                 
                 if success:
-                    self.root.after(0, lambda: self.on_quest_push_complete(True, message))
+                    self.root.after(0, self.on_quest_push_complete, True, message)
                 else:
-                    self.root.after(0, lambda: self.on_quest_push_complete(False, message))
+                    self.root.after(0, self.on_quest_push_complete, False, message)
                     
             except Exception as thread_error:
                 error_message = f"Push thread error: {str(thread_error)}"
-                self.root.after(0, lambda: self.on_quest_push_complete(False, error_message))
+                self.root.after(0, self.on_quest_push_complete, False, error_message)
         
         threading.Thread(target=push_thread, daemon=True).start()
     
@@ -2061,6 +3200,20 @@ class EchoVRTextureViewer:
         self.push_quest_btn.config(state=tk.NORMAL, bg=self.colors['accent_orange'], text="Push Files To Quest")
         self.update_quest_push_button()
     
+    def apply_folder_layout(self, path, textures_folder, is_quest, message):
+        corresponding_id = FOLDER_LAYOUTS[os.path.basename(textures_folder)][0]
+        self.textures_folder = textures_folder
+        self.corresponding_folder = os.path.join(path, corresponding_id)
+        self.is_quest_textures = is_quest
+        self.is_pcvr_textures = not is_quest
+        
+        if is_quest:
+            self.platform_label.config(text="Platform: Quest (ASTC)", fg=self.colors['success'])
+        else:
+            self.platform_label.config(text="Platform: PCVR (DDS)", fg=self.colors['accent_blue'])
+            self.push_quest_btn.config(state=tk.DISABLED, bg=self.colors['bg_light'])
+        self.log_info(message)
+    
     def set_output_folder(self, path):
         self.output_folder = path
         
@@ -2068,50 +3221,25 @@ class EchoVRTextureViewer:
         
         # Simplified Logic for path detection
         if "quest" in folder_name:
-            self.is_quest_textures = True
-            self.is_pcvr_textures = False
-            self.textures_folder = os.path.join(path, "5231972605540061417")
-            self.corresponding_folder = os.path.join(path, "-2094201140079393352")
-            self.platform_label.config(text="Platform: Quest (ASTC)", fg=self.colors['success'])
-            self.log_info("🎯 Switched to Quest mode")
+            self.apply_folder_layout(path, os.path.join(path, QUEST_TEXTURES_ID), True, "🎯 Switched to Quest mode")
             
         elif "pcvr" in folder_name:
-            self.is_quest_textures = False
-            self.is_pcvr_textures = True
-            self.textures_folder = os.path.join(path, "-4707359568332879775")
-            self.corresponding_folder = os.path.join(path, "5353709876897953952")
-            self.platform_label.config(text="Platform: PCVR (DDS)", fg=self.colors['accent_blue'])
-            self.push_quest_btn.config(state=tk.DISABLED, bg=self.colors['bg_light'])
-            self.log_info("🎮 Switched to PCVR mode")
+            self.apply_folder_layout(path, os.path.join(path, PCVR_TEXTURES_ID), False, "🎮 Switched to PCVR mode")
             
         else:
-            # Fallback checks
-            quest_textures_folder = os.path.join(path, "5231972605540061417")
-            pcvr_textures_folder = os.path.join(path, "-4707359568332879775")
-            
-            # Check parent directory if running as executable
-            if getattr(sys, 'frozen', False):
-                parent_dir = os.path.dirname(os.path.dirname(path))
-                if not os.path.exists(quest_textures_folder):
-                    quest_textures_folder = os.path.join(parent_dir, os.path.basename(path), "5231972605540061417")
-                if not os.path.exists(pcvr_textures_folder):
-                    pcvr_textures_folder = os.path.join(parent_dir, os.path.basename(path), "-4707359568332879775")
-            
-            if os.path.exists(quest_textures_folder):
-                self.textures_folder = quest_textures_folder
-                self.corresponding_folder = os.path.join(path, "-2094201140079393352")
-                self.is_quest_textures = True
-                self.is_pcvr_textures = False
-                self.platform_label.config(text="Platform: Quest (ASTC)", fg=self.colors['success'])
-                self.log_info("🎯 Auto-detected Quest textures")
-            elif os.path.exists(pcvr_textures_folder):
-                self.textures_folder = pcvr_textures_folder
-                self.corresponding_folder = os.path.join(path, "5353709876897953952")
-                self.is_quest_textures = False
-                self.is_pcvr_textures = True
-                self.platform_label.config(text="Platform: PCVR (DDS)", fg=self.colors['accent_blue'])
-                self.push_quest_btn.config(state=tk.DISABLED, bg=self.colors['bg_light'])
-                self.log_info("🎮 Auto-detected PCVR textures")
+            # Fallback checks, Quest layout first
+            parent_dir = os.path.dirname(os.path.dirname(path))
+            for folder_id, (_, is_quest) in FOLDER_LAYOUTS.items():
+                textures_folder = os.path.join(path, folder_id)
+                
+                # Check parent directory if running as executable
+                if getattr(sys, 'frozen', False) and not os.path.exists(textures_folder):
+                    textures_folder = os.path.join(parent_dir, os.path.basename(path), folder_id)
+                
+                if os.path.exists(textures_folder):
+                    message = "🎯 Auto-detected Quest textures" if is_quest else "🎮 Auto-detected PCVR textures"
+                    self.apply_folder_layout(path, textures_folder, is_quest, message)
+                    break
             else:
                 self.textures_folder = path # Fallback to using the root
                 self.log_info("⚠ Could not determine platform structure, using root folder")
@@ -2124,22 +3252,86 @@ class EchoVRTextureViewer:
             ConfigManager.save_config(output_folder=self.output_folder)
             self.update_quest_push_button()
     
+    def set_file_list(self, items):
+        # Same end state as delete(0, END) + insert: nothing selected, scrolled to the top
+        self.file_list.selection_clear(0, tk.END)
+        self.file_list_var.set(items)
+        self.file_list.yview_moveto(0)
+    
+    def schedule_filter(self, event=None):
+        # Coalesce fast typing into one filter pass; clearing the box still refreshes right away
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+            self._filter_job = None
+        
+        # Shift, arrows etc. also fire KeyRelease; nothing to redo if the text didn't change
+        if self.search_var.get().casefold() == self._filter_query:
+            return
+        
+        if self.search_var.get():
+            self._filter_job = self.root.after(FILTER_DEBOUNCE_MS, self.filter_textures)
+        else:
+            self.filter_textures()
+    
     def filter_textures(self, event=None):
-        search_text = self.search_var.get().lower()
+        self._filter_job = None
+        search_text = self.search_var.get().casefold()
+        previous_query = self._filter_query
+        self._filter_query = search_text
         
         if not search_text:
-            self.filtered_textures = self.all_textures.copy()
+            self.filtered_textures = self.all_textures
+            self.filtered_textures_lower = self.all_textures_lower
         else:
-            self.filtered_textures = [texture for texture in self.all_textures if search_text in texture.lower()]
+            # Typing more only narrows the result, so search the current matches instead of everything
+            if previous_query and search_text.startswith(previous_query):
+                names, lowers = self.filtered_textures, self.filtered_textures_lower
+            else:
+                names, lowers = self.all_textures, self.all_textures_lower
+            # Build one match mask, then let compress() pick both lists in C
+            mask = [search_text in lower for lower in lowers]
+            self.filtered_textures = list(itertools.compress(names, mask))
+            self.filtered_textures_lower = list(itertools.compress(lowers, mask))
         
-        self.file_list.delete(0, tk.END)
-        for texture in self.filtered_textures:
-            self.file_list.insert(tk.END, texture)
+        self.set_file_list(self.filtered_textures)
     
     def clear_search(self):
         self.search_var.set("")
         self.filter_textures()
     
+    def read_texture_cache_file(self, cache_path):
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+        cached = self._texture_cache_files.get(cache_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # Plain-text side copy of the name set, one name per line; splitting lines is much cheaper
+        # than parsing the JSON. The first line is the JSON mtime it was built from and is checked
+        # before anything else is read, so any change to cache.json invalidates it.
+        names_path = os.path.splitext(cache_path)[0] + ".names.txt"
+        names = None
+        try:
+            with open(names_path, 'r', encoding='utf-8') as f:
+                if f.readline().strip() == str(mtime_ns):
+                    names = set(f.read().splitlines())
+        except (OSError, ValueError):
+            names = None
+        
+        if names is None:
+            with open(cache_path, 'r') as f:
+                names = set(json.load(f))
+            try:
+                temp_path = names_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(f"{mtime_ns}\n")
+                    f.write("\n".join(names))
+                os.replace(temp_path, names_path)
+            except OSError:
+                pass
+        
+        self._texture_cache_files[cache_path] = (mtime_ns, names)
+        return names
+    
     def load_texture_cache(self):
         # Kept for compatibility with old cache method, though we prefer the new TextureCacheManager
         if self.is_quest_textures:
@@ -2150,10 +3342,7 @@ class EchoVRTextureViewer:
                     cache_path = os.path.join(check_dir, "cache.json")
                     if os.path.exists(cache_path):
                         try:
-                            with open(cache_path, 'r') as f:
-                                cache_data = json.load(f)
-                            
-                            self.texture_cache = {key: True for key in cache_data.keys()}
+                            self.texture_cache = self.read_texture_cache_file(cache_path)
                             self.log_info(f"Loaded texture cache: {len(self.texture_cache)} textures")
                             return
                         except Exception as e:
@@ -2164,20 +3353,17 @@ class EchoVRTextureViewer:
                 
                 if os.path.exists(cache_path):
                     try:
-                        with open(cache_path, 'r') as f:
-                            cache_data = json.load(f)
-                        
-                        self.texture_cache = {key: True for key in cache_data.keys()}
+                        self.texture_cache = self.read_texture_cache_file(cache_path)
                         self.log_info(f"Loaded texture cache: {len(self.texture_cache)} textures")
                         
                     except Exception as e:
                         self.log_info(f"Error loading cache.json: {e}")
-                        self.texture_cache = {}
+                        self.texture_cache = set()
                 else:
                     self.log_info("cache.json not found")
-                    self.texture_cache = {}
+                    self.texture_cache = set()
         else:
-            self.texture_cache = {}
+            self.texture_cache = set()
     
     def is_texture_file(self, file_name):
         # This function is now mostly used inside the background thread logic
@@ -2188,13 +3374,11 @@ class EchoVRTextureViewer:
                 return True
             return False
         
-        # PCVR check moved to bulk heuristic
-        if file_name.lower().endswith('.dds'): return True
-        return True # Default assume true if heuristic passed
+        # PCVR check moved to bulk heuristic, which already kept only DDS files
+        return True
     
     def load_textures(self):
-        self.file_list.delete(0, tk.END)
-        self.file_list.insert(tk.END, "Loading textures...")
+        self.set_file_list(("Loading textures...",))
         self.update_canvas_placeholder(self.original_canvas, "Loading textures...")
         self.root.update_idletasks()
         
@@ -2206,7 +3390,7 @@ class EchoVRTextureViewer:
 
     def _load_textures_worker(self):
         if not self.textures_folder or not os.path.exists(self.textures_folder):
-             self.root.after(0, lambda: self._on_textures_loaded([], 0))
+             self.root.after(0, self._on_textures_loaded, [], 0)
              return
 
         def update_platform_ui():
@@ -2224,14 +3408,8 @@ class EchoVRTextureViewer:
             is_dds = False
             if len(cached_files) > 0:
                 check_file = os.path.join(self.textures_folder, cached_files[0])
-                # We check if the file still exists and verify its header
-                if os.path.exists(check_file):
-                    try:
-                        with open(check_file, 'rb') as f:
-                            sig = f.read(4)
-                            if sig == b'DDS ':
-                                is_dds = True
-                    except: pass
+                # A missing or unreadable file simply isn't DDS
+                is_dds = DDSHandler.has_dds_signature(check_file)
             
             if is_dds:
                 self.is_pcvr_textures = True
@@ -2241,7 +3419,7 @@ class EchoVRTextureViewer:
                 self.is_quest_textures = True
                 
             self.root.after(0, update_platform_ui)
-            self.root.after(0, lambda: self._on_textures_loaded(cached_files, len(cached_files)))
+            self.root.after(0, self._on_textures_loaded, cached_files, len(cached_files))
             return
 
         # 2. No Cache - Full Scan & Filter
@@ -2250,20 +3428,25 @@ class EchoVRTextureViewer:
         all_files_scanned = []
         
         try:
-            raw_file_list = os.listdir(self.textures_folder)
-            
             # --- PCVR CHECK: Look for DDS headers ---
-            for f in raw_file_list:
-                full_path = os.path.join(self.textures_folder, f)
-                if os.path.isfile(full_path):
-                    all_files_scanned.append(f)
-                    try:
-                        with open(full_path, 'rb') as f_obj:
-                            sig = f_obj.read(4)
-                            if sig == b'DDS ':
-                                dds_files.append(f)
-                    except:
-                        pass
+            # scandir hands back the file type with the listing, so no extra stat per file,
+            # and files already named .dds don't need their header opened
+            to_sniff = []
+            with os.scandir(self.textures_folder) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    all_files_scanned.append(entry.name)
+                    if entry.name.lower().endswith('.dds'):
+                        dds_files.append(entry.name)
+                    else:
+                        to_sniff.append(entry)
+            
+            # Each sniff is an independent open + 4-byte read that mostly waits on the disk
+            if to_sniff:
+                with ThreadPoolExecutor(max_workers=SNIFF_WORKERS) as executor:
+                    is_dds = executor.map(DDSHandler.has_dds_signature, [entry.path for entry in to_sniff])
+                    dds_files.extend(itertools.compress([entry.name for entry in to_sniff], is_dds))
             
             # Decision Time: If we found ANY DDS files, assume PCVR and filter strictly.
             if len(dds_files) > 0:
@@ -2305,23 +3488,29 @@ class EchoVRTextureViewer:
                      # Fallback if no mapping exists (dangerous, but necessary if fresh install without cache)
                      valid_files = all_files_scanned
 
+            # One summary line for the whole scan rather than anything per file
+            skipped = len(all_files_scanned) - len(valid_files)
+            self.post_log(f"Scanned {len(all_files_scanned)} files, kept {len(valid_files)}, filtered {skipped}")
+            
             # Update Cache with the filtered list
             TextureCacheManager.update_cache(self.textures_folder, valid_files)
             
             self.root.after(0, update_platform_ui)
-            self.root.after(0, lambda: self._on_textures_loaded(valid_files, len(valid_files)))
+            self.root.after(0, self._on_textures_loaded, valid_files, len(valid_files))
             
         except Exception as e:
-            print(f"Scan Error: {e}")
-            self.root.after(0, lambda: self._on_textures_loaded([], 0))
+            logger.warning("Scan Error: %s", e)
+            self.root.after(0, self._on_textures_loaded, [], 0)
 
     def _on_textures_loaded(self, files, count):
         self.all_textures = sorted(files)
-        self.filtered_textures = self.all_textures.copy()
+        self.all_textures_lower = [texture.casefold() for texture in self.all_textures]
+        # The lists are only ever replaced, never mutated, so the filtered view can share them
+        self.filtered_textures = self.all_textures
+        self.filtered_textures_lower = self.all_textures_lower
+        self._filter_query = ""
         
-        self.file_list.delete(0, tk.END)
-        for file_name in self.filtered_textures:
-            self.file_list.insert(tk.END, file_name)
+        self.set_file_list(self.filtered_textures)
             
         platform_text = "Quest" if self.is_quest_textures else "PCVR"
         status_text = f"Found {count} {platform_text} texture files"
@@ -2333,6 +3522,16 @@ class EchoVRTextureViewer:
             self.update_canvas_placeholder(self.original_canvas, "No textures found")
         else:
             self.update_canvas_placeholder(self.original_canvas, "Select a texture to view")
+        
+        self._precache_generation += 1
+        if self.is_pcvr_textures and count:
+            paths = [os.path.join(self.textures_folder, name) for name in self.all_textures]
+            threading.Thread(target=self._precache_worker, args=(paths, self._precache_generation), daemon=True).start()
+    
+    def _precache_worker(self, paths, generation):
+        converted = TextureLoader.precache_texconv_previews(paths, lambda: self._precache_generation == generation)
+        if converted:
+            self.post_log(f"Pre-converted {converted} textures with texconv")
 
     def on_texture_selected(self, event):
         if not self.file_list.curselection():
@@ -2341,37 +3540,74 @@ class EchoVRTextureViewer:
         index = self.file_list.curselection()[0]
         texture_name = self.filtered_textures[index]
         self.current_texture = os.path.join(self.textures_folder, texture_name)
+        # The cached name/size belong to the previous texture
+        self.original_info = None
         
         try:
+            # PCVR info comes from the DDS header, so only the canvas-sized preview is needed.
+            # Quest dimensions are read off the decoded image and need the full size.
+            preview_size = None if self.is_quest_textures else self.get_canvas_size(self.original_canvas)
+            
+            # Recently viewed textures are still decoded in memory; show them without a worker round trip
+            memory_key, image, info = TextureLoader.peek_loaded_texture(self.current_texture, self.is_quest_textures, preview_size)
+            if image is not None:
+                self.display_texture_result(image, info, memory_key)
+                return
+            
             self.update_canvas_placeholder(self.original_canvas, "Loading texture...")
             self.root.update_idletasks()
             
-            def load_texture_thread():
-                try:
-                    image = TextureLoader.load_texture(self.current_texture, self.is_quest_textures)
-                    self.root.after(0, lambda: self.display_texture_result(image))
-                except Exception as e:
-                    self.root.after(0, lambda: self.display_texture_error(e))
-            
-            threading.Thread(target=load_texture_thread, daemon=True).start()
+            self._decode_queue.put((self.current_texture, self.is_quest_textures, preview_size))
             
         except Exception as e:
             self.log_info(f"Error loading texture: {e}")
             self.update_canvas_placeholder(self.original_canvas, "Error loading texture")
     
-    def display_texture_result(self, image):
+    def _decode_worker(self):
+        while True:
+            request = self._decode_queue.get()
+            # Skip selections the user has already scrolled past
+            while not self._decode_queue.empty():
+                try:
+                    request = self._decode_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            texture_path, is_quest, preview_size = request
+            try:
+                image = TextureLoader.load_texture(texture_path, is_quest, preview_size)
+                self.root.after(0, self._apply_preview, image, texture_path)
+            except Exception as e:
+                self.root.after(0, self._apply_preview_error, e, texture_path)
+    
+    def _apply_preview(self, image, texture_path):
+        if texture_path == self.current_texture:
+            self.display_texture_result(image)
+    
+    def _apply_preview_error(self, error, texture_path):
+        if texture_path == self.current_texture:
+            self.display_texture_error(error)
+    
+    def display_texture_result(self, image, info=None, memory_key=None):
         if image:
             self.display_image_on_canvas(image, self.original_canvas)
             
-            if self.is_quest_textures:
-                self.original_info = {
-                    'file_size': os.path.getsize(self.current_texture),
-                    'format': 'ASTC',
-                    'width': image.width,
-                    'height': image.height
-                }
-            else:
-                self.original_info = DDSHandler.get_dds_info(self.current_texture)
+            if info is None:
+                if self.is_quest_textures:
+                    info = {
+                        # The memory key already carries the stat'ed size
+                        'file_size': memory_key[1] if memory_key else os.path.getsize(self.current_texture),
+                        'format': 'ASTC',
+                        'width': image.width,
+                        'height': image.height
+                    }
+                else:
+                    info = DDSHandler.get_dds_info(self.current_texture)
+                if memory_key and info:
+                    TextureLoader.remember_loaded_info(memory_key, info)
+            if info is not None and 'basename' not in info:
+                info['basename'] = os.path.basename(self.current_texture)
+            self.original_info = info
             
             self.update_texture_info()
             self.edit_btn.config(state=tk.NORMAL, bg=self.colors['accent_blue'])
@@ -2400,16 +3636,46 @@ class EchoVRTextureViewer:
         
         if file_path:
             self.replacement_texture = file_path
+            preview_size = self.get_canvas_size(self.replacement_canvas)
             try:
+                # Picking the same unchanged file again needs no decode
+                stat = os.stat(file_path)
+                cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, self.is_quest_textures, preview_size)
+                cached = self._replacement_cache.get(cache_key)
+                if cached is not None:
+                    self._replacement_cache.move_to_end(cache_key)
+                    self.display_replacement_result(cached[0], file_path, cached[1])
+                    return
+                
                 def load_replacement_thread():
                     try:
+                        # Dimensions come from the header alone, so the info panels are filled in
+                        # before the pixel decode rather than after it
                         if self.is_quest_textures:
-                            image = Image.open(file_path).convert("RGBA")
+                            image = Image.open(file_path)
+                            info = {
+                                'file_size': stat.st_size,
+                                'format': 'PNG',
+                                'width': image.width,
+                                'height': image.height
+                            }
                         else:
-                            image = TextureLoader.load_texture(file_path, False)
-                        self.root.after(0, lambda: self.display_replacement_result(image, file_path))
+                            info = DDSHandler.get_dds_info(file_path)
+                        if info is not None:
+                            info['basename'] = os.path.basename(file_path)
+                            self.root.after(0, self._apply_replacement_info, info, file_path)
+                        
+                        if self.is_quest_textures:
+                            # Opaque sources stay RGB; an unused alpha band only adds work to every resize
+                            if image.mode not in ("RGB", "RGBA"):
+                                has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+                                image = image.convert("RGBA" if has_alpha else "RGB")
+                            image.load()
+                        else:
+                            image = TextureLoader.load_texture(file_path, False, preview_size)
+                        self.root.after(0, self.display_replacement_result, image, file_path, info, cache_key)
                     except Exception as e:
-                        self.root.after(0, lambda: self.display_replacement_error(e))
+                        self.root.after(0, self.display_replacement_error, e)
                 
                 threading.Thread(target=load_replacement_thread, daemon=True).start()
                 
@@ -2417,49 +3683,100 @@ class EchoVRTextureViewer:
                 self.log_info(f"Error loading replacement texture: {e}")
                 self.update_canvas_placeholder(self.replacement_canvas, "Error loading replacement")
     
-    def display_replacement_result(self, image, file_path):
+    def display_replacement_result(self, image, file_path, info=None, cache_key=None):
         if image:
+            if cache_key:
+                self._replacement_cache[cache_key] = (image, info)
+                while len(self._replacement_cache) > REPLACEMENT_CACHE_SIZE:
+                    self._replacement_cache.popitem(last=False)
             self.display_image_on_canvas(image, self.replacement_canvas)
             
-            if self.is_quest_textures:
-                self.replacement_info = {
-                    'file_size': os.path.getsize(file_path),
-                    'format': 'PNG',
-                    'width': image.width,
-                    'height': image.height
-                }
-                self.replacement_size = None
-            else:
-                self.replacement_info = DDSHandler.get_dds_info(file_path)
-                self.replacement_size = self.replacement_info['file_size']
-                
-            self.update_texture_info()
-            self.check_resolution_match()
-            self.log_info(f"Replacement loaded: {os.path.basename(file_path)}")
+            if info is None:
+                if self.is_quest_textures:
+                    info = {
+                        'file_size': os.path.getsize(file_path),
+                        'format': 'PNG',
+                        'width': image.width,
+                        'height': image.height
+                    }
+                else:
+                    info = DDSHandler.get_dds_info(file_path)
+                info['basename'] = os.path.basename(file_path)
+            # Usually already applied from the header pass
+            if info is not self.replacement_info:
+                self.set_replacement_info(info)
+            self.log_info(f"Replacement loaded: {self.replacement_info['basename']}")
             if self.replacement_size:
                 self.log_info(f"Replacement size: {self.replacement_size} bytes")
         else:
             self.update_canvas_placeholder(self.replacement_canvas, "Failed to load replacement")
     
+    def _apply_replacement_info(self, info, file_path):
+        # Header-only info from the loader thread; skip it if another file was picked since
+        if file_path == self.replacement_texture:
+            self.set_replacement_info(info)
+    
+    def set_replacement_info(self, info):
+        self.replacement_info = info
+        self.replacement_size = None if self.is_quest_textures else info['file_size']
+        self.update_texture_info()
+        self.check_resolution_match()
+    
     def display_replacement_error(self, error):
         self.log_info(f"Error loading replacement texture: {error}")
         self.update_canvas_placeholder(self.replacement_canvas, "Error loading replacement")
     
-    def display_image_on_canvas(self, image, canvas):
-        canvas.delete("all")
-        
+    def get_canvas_size(self, canvas):
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
         
         if canvas_width <= 1 or canvas_height <= 1:
             canvas_width, canvas_height = 400, 300
+        return canvas_width, canvas_height
+    
+    @staticmethod
+    def scale_preview(image, new_size, ratio):
+        # LANCZOS only where it shows, near 1:1. Otherwise BILINEAR, with reducing_gap letting
+        # Pillow box-reduce big sources by an integer factor first, inside the same call
+        if ratio >= 0.9:
+            return image.resize(new_size, Image.Resampling.LANCZOS)
+        return image.resize(new_size, Image.Resampling.BILINEAR, reducing_gap=PREVIEW_REDUCING_GAP)
+    
+    def display_image_on_canvas(self, image, canvas):
+        canvas.delete("all")
         
-        img_width, img_height = image.size
-        ratio = min(canvas_width / img_width, canvas_height / img_height)
-        new_size = (int(img_width * ratio), int(img_height * ratio))
+        canvas_width, canvas_height = self.get_canvas_size(canvas)
         
-        resized_image = image.resize(new_size, Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(resized_image)
+        # Redrawing an image at the same canvas size reuses its finished PhotoImage and skips the
+        # LANCZOS resize. The weakref makes sure a recycled id() never maps to another image.
+        cache_key = (id(image), canvas_width, canvas_height)
+        entry = self._photo_cache.get(cache_key)
+        if entry is not None and entry[0]() is image:
+            self._photo_cache.move_to_end(cache_key)
+            photo, photo_key = entry[1], entry[2]
+            new_size = photo_key[0]
+        else:
+            img_width, img_height = image.size
+            ratio = min(canvas_width / img_width, canvas_height / img_height)
+            new_size = (int(img_width * ratio), int(img_height * ratio))
+            
+            resized_image = self.scale_preview(image, new_size, ratio)
+            
+            # Browsing mostly shows same-sized previews. Once the cache is full, the entry it is
+            # about to drop gives up its Tk photo to be refilled instead of allocating a new one,
+            # as long as that photo isn't on screen in the other canvas.
+            photo_key = (resized_image.size, resized_image.mode)
+            photo = None
+            if len(self._photo_cache) >= PHOTO_CACHE_SIZE:
+                _, oldest = self._photo_cache.popitem(last=False)
+                on_screen = [getattr(other, 'image', None) for other in (self.original_canvas, self.replacement_canvas) if other is not canvas]
+                if oldest[2] == photo_key and all(oldest[1] is not shown for shown in on_screen):
+                    photo = oldest[1]
+                    photo.paste(resized_image)
+            if photo is None:
+                photo = ImageTk.PhotoImage(resized_image)
+            
+            self._photo_cache[cache_key] = (weakref.ref(image), photo, photo_key)
         
         x_pos = (canvas_width - new_size[0]) // 2
         y_pos = (canvas_height - new_size[1]) // 2
@@ -2468,54 +3785,49 @@ class EchoVRTextureViewer:
         canvas.image = photo
     
     def update_texture_info(self):
-        info = ""
+        parts = []
         
         if self.original_info:
             platform_text = "Quest" if self.is_quest_textures else "PCVR"
-            info += f"=== ORIGINAL TEXTURE ({platform_text}) ===\n"
-            info += f"File: {os.path.basename(self.current_texture)}\n"
-            info += f"Size: {self.original_info['file_size']:,} bytes\n"
+            parts.append(f"=== ORIGINAL TEXTURE ({platform_text}) ===\n")
+            parts.append(f"File: {self.original_info['basename']}\n")
+            parts.append(f"Size: {self.original_info['file_size']:,} bytes\n")
             if 'width' in self.original_info and 'height' in self.original_info:
-                info += f"Dimensions: {self.original_info['width']} x {self.original_info['height']}\n"
-            info += f"Format: {self.original_info['format']}\n"
+                parts.append(f"Dimensions: {self.original_info['width']} x {self.original_info['height']}\n")
+            parts.append(f"Format: {self.original_info['format']}\n")
             if 'mipmaps' in self.original_info:
-                info += f"Mipmaps: {self.original_info.get('mipmaps', 1)}\n"
-            info += "\n"
+                parts.append(f"Mipmaps: {self.original_info.get('mipmaps', 1)}\n")
+            parts.append("\n")
         
         if self.replacement_info:
-            info += "=== REPLACEMENT TEXTURE ===\n"
-            info += f"File: {os.path.basename(self.replacement_texture)}\n"
-            info += f"Size: {self.replacement_info['file_size']:,} bytes\n"
+            parts.append("=== REPLACEMENT TEXTURE ===\n")
+            parts.append(f"File: {self.replacement_info['basename']}\n")
+            parts.append(f"Size: {self.replacement_info['file_size']:,} bytes\n")
             if 'width' in self.replacement_info and 'height' in self.replacement_info:
-                info += f"Dimensions: {self.replacement_info['width']} x {self.replacement_info['height']}\n"
-            info += f"Format: {self.replacement_info['format']}\n"
+                parts.append(f"Dimensions: {self.replacement_info['width']} x {self.replacement_info['height']}\n")
+            parts.append(f"Format: {self.replacement_info['format']}\n")
             if 'mipmaps' in self.replacement_info:
-                info += f"Mipmaps: {self.replacement_info.get('mipmaps', 1)}\n"
-            info += "\n"
+                parts.append(f"Mipmaps: {self.replacement_info.get('mipmaps', 1)}\n")
+            parts.append("\n")
         
         if self.original_info and self.replacement_info:
-            info += "=== COMPARISON ===\n"
+            parts.append("=== COMPARISON ===\n")
             
-            if 'width' in self.original_info and 'height' in self.original_info and 'width' in self.replacement_info and 'height' in self.replacement_info:
-                orig_width = self.original_info['width']
-                orig_height = self.original_info['height']
-                rep_width = self.replacement_info['width']
-                rep_height = self.replacement_info['height']
-                
-                if orig_width == rep_width and orig_height == rep_height:
-                    info += "✓ Dimensions match\n"
-                else:
-                    info += f"✗ Dimension mismatch: {orig_width}x{orig_height} vs {rep_width}x{rep_height}\n"
+            dimensions_match = self._dimensions_match()
+            if dimensions_match:
+                parts.append("✓ Dimensions match\n")
+            elif dimensions_match is not None:
+                parts.append(f"✗ Dimension mismatch: {self.original_info['width']}x{self.original_info['height']} vs {self.replacement_info['width']}x{self.replacement_info['height']}\n")
             
             orig_format = self.original_info['format']
             rep_format = self.replacement_info['format']
             
             if self.is_quest_textures:
-                info += "⚠ Quest texture - will be encoded to ASTC\n"
+                parts.append("⚠ Quest texture - will be encoded to ASTC\n")
             elif orig_format == rep_format:
-                info += f"✓ Format match: {orig_format}\n"
+                parts.append(f"✓ Format match: {orig_format}\n")
             else:
-                info += f"⚠ Format difference: {orig_format} vs {rep_format}\n"
+                parts.append(f"⚠ Format difference: {orig_format} vs {rep_format}\n")
                 
             if not self.is_quest_textures and self.replacement_size:
                 orig_size = self.original_info['file_size']
@@ -2524,21 +3836,27 @@ class EchoVRTextureViewer:
                 size_percent = (size_diff / orig_size) * 100 if orig_size > 0 else 0
                 
                 if abs(size_percent) < 10:
-                    info += f"✓ Size similar: {orig_size:,} vs {rep_size:,} bytes ({size_percent:+.1f}%)\n"
+                    parts.append(f"✓ Size similar: {orig_size:,} vs {rep_size:,} bytes ({size_percent:+.1f}%)\n")
                 else:
-                    info += f"⚠ Size difference: {orig_size:,} vs {rep_size:,} bytes ({size_percent:+.1f}%)\n"
+                    parts.append(f"⚠ Size difference: {orig_size:,} vs {rep_size:,} bytes ({size_percent:+.1f}%)\n")
         
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, info)
+        # One edit instead of delete + insert, so the widget re-lays out the text once
+        self.info_text.replace(1.0, tk.END, "".join(parts))
+    
+    def _dimensions_match(self):
+        # None when either side has no dimensions to compare
+        original, replacement = self.original_info, self.replacement_info
+        if not (original and replacement):
+            return None
+        try:
+            return (original['width'], original['height']) == (replacement['width'], replacement['height'])
+        except KeyError:
+            return None
     
     def check_resolution_match(self):
-        if self.original_info and self.replacement_info and 'width' in self.original_info and 'height' in self.original_info and 'width' in self.replacement_info and 'height' in self.replacement_info:
-            orig_width = self.original_info['width']
-            orig_height = self.original_info['height']
-            rep_width = self.replacement_info['width']
-            rep_height = self.replacement_info['height']
-            
-            if orig_width == rep_width and orig_height == rep_height:
+        dimensions_match = self._dimensions_match()
+        if dimensions_match is not None:
+            if dimensions_match:
                 self.resolution_status.config(text="✓ Resolutions match", fg=self.colors['success'])
             else:
                 self.resolution_status.config(text="✗ Resolutions don't match", fg=self.colors['warning'])
@@ -2552,10 +3870,11 @@ class EchoVRTextureViewer:
         try:
             if sys.platform == 'win32':
                 os.startfile(self.current_texture)
-            elif sys.platform == 'darwin':
-                subprocess.call(('open', self.current_texture))
             else:
-                subprocess.call(('xdg-open', self.current_texture))
+                # Launch and move on; call() would hold the Tk thread until the opener exits
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen((opener, self.current_texture), stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open external editor: {str(e)}")
     
@@ -2598,52 +3917,138 @@ class EchoVRTextureViewer:
             self.log_info("Download already in progress...")
             return
 
-        confirm = messagebox.askyesno("Download Textures", "This will download a texture cache archive (~200-500MB) from GitHub \nand extract it to the local '_internal' folder.\n\nThis may take a while depending on your internet connection.\n\nContinue?")
-        if not confirm:
-            return
+        # Only fetch the half of the cache for the platform that is loaded, both if unknown
+        if self.is_quest_textures:
+            platform_key = 'quest'
+        elif self.is_pcvr_textures:
+            platform_key = 'pcvr'
+        else:
+            platform_key = None
+        platform_text = {'quest': "Quest", 'pcvr': "PCVR"}.get(platform_key, "full")
+
+        # Handshake with GitHub while the user is still reading the prompt
+        first_url = TEXTURE_CACHE_PLATFORM_URLS.get(platform_key, TEXTURE_CACHE_URL)
+        threading.Thread(target=self._http.prewarm, args=(first_url,), daemon=True).start()
+
+        popup = tk.Toplevel(self.root)
+        popup.title("Download Textures")
+        popup.geometry("460x220")
+        popup.configure(bg=self.colors['bg_medium'])
+        popup.resizable(False, False)
+        popup.transient(self.root)
+        popup.grab_set()
+
+        try:
+            x = self.root.winfo_x() + (self.root.winfo_width() - 460) // 2
+            y = self.root.winfo_y() + (self.root.winfo_height() - 220) // 2
+            popup.geometry(f"+{x}+{y}")
+        except: pass
+
+        tk.Label(popup, text=f"Download {platform_text} texture cache?", font=("Arial", 12, "bold"), fg=self.colors['text_light'], bg=self.colors['bg_medium']).pack(pady=(20, 10))
+        tk.Label(popup, text="This will download a texture cache archive (~200-500MB) from GitHub\nand extract it to the local '_internal' folder.\n\nThis may take a while depending on your internet connection.", font=("Arial", 9), fg=self.colors['text_muted'], bg=self.colors['bg_medium'], justify=tk.CENTER).pack(pady=(0, 15))
+
+        btn_frame = tk.Frame(popup, bg=self.colors['bg_medium'])
+        btn_frame.pack()
+
+        def on_confirm():
+            popup.destroy()
+            self._start_download(platform_key)
+
+        def on_cancel():
+            popup.destroy()
+            self._http.close()
+
+        tk.Button(btn_frame, text="Download", command=on_confirm, bg=self.colors['accent_blue'], fg=self.colors['text_light'], font=("Arial", 10, "bold"), relief=tk.RAISED, padx=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Cancel", command=on_cancel, bg=self.colors['bg_light'], fg=self.colors['text_light'], font=("Arial", 10), relief=tk.RAISED, padx=15).pack(side=tk.LEFT, padx=5)
+        popup.protocol("WM_DELETE_WINDOW", on_cancel)
 
+    def _start_download(self, platform_key):
         self.is_downloading = True
         self.download_btn.config(state=tk.DISABLED, text="Downloading...", bg=self.colors['accent_orange'])
         self.log_info("⬇ Starting texture cache download...")
         
-        threading.Thread(target=self._download_worker, daemon=True).start()
-
-    def _download_worker(self):
-        url = "https://github.com/heisthecat31/EchoVR-Texture-Editor/releases/download/quest/texture_cache.zip"
-        
-        if getattr(sys, 'frozen', False):
-             application_path = os.path.dirname(sys.executable)
-        else:
-             application_path = os.path.dirname(os.path.abspath(__file__))
-             
-        extract_to_path = os.path.join(application_path, "_internal")
-        temp_zip_path = os.path.join(tempfile.gettempdir(), "texture_cache.zip")
+        threading.Thread(target=self._download_worker, args=(platform_key,), daemon=True).start()
+
+    def _download_archive(self, url, temp_zip_path):
+        # Hash while streaming so a truncated/corrupt archive is caught before extraction
+        digest = hashlib.sha256()
+        with self._http.get(url) as response, open(temp_zip_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            total_size = int(response.getheader('Content-Length') or 0)
+            if total_size:
+                preallocate_file(f, total_size)
+            while True:
+                chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+            # Drop any preallocated tail if the server sent less than it announced
+            f.truncate()
+        return digest
+
+    def _download_worker(self, platform_key=None):
+        extract_to_path = self._extract_path
+        temp_zip_path = self._temp_zip
 
         try:
-            self.root.after(0, lambda: self.log_info(f"Downloading from: {url}"))
-            urllib.request.urlretrieve(url, temp_zip_path)
-            self.root.after(0, lambda: self.log_info("✓ Download complete."))
-
-            self.root.after(0, lambda: self.log_info(f"Extracting to: {extract_to_path}"))
-            if not os.path.exists(extract_to_path):
-                os.makedirs(extract_to_path)
+            urls = [TEXTURE_CACHE_URL]
+            if platform_key in TEXTURE_CACHE_PLATFORM_URLS:
+                urls.insert(0, TEXTURE_CACHE_PLATFORM_URLS[platform_key])
+            
+            for url in urls:
+                self.post_log(f"Downloading from: {url}")
+                try:
+                    digest = self._download_archive(url, temp_zip_path)
+                    break
+                except urllib.error.HTTPError as http_error:
+                    if http_error.code != 404 or url == urls[-1]:
+                        raise
+                    self.post_log("⚠ Platform archive not published, falling back to the full cache")
+            self.post_log("✓ Download complete.")
+
+            expected_digest = self._fetch_expected_digest(url + ".sha256")
+            archive_verified = False
+            if expected_digest is None:
+                self.post_log("⚠ No published checksum found, skipping integrity check")
+            elif digest.hexdigest() != expected_digest:
+                raise ValueError("Checksum mismatch, the downloaded archive is corrupt. Please try again.")
+            else:
+                archive_verified = True
+                self.post_log("✓ Checksum verified.")
 
-            with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to_path)
+            self.post_log(f"Extracting to: {extract_to_path}")
+            # Per-member CRC checks are redundant once the whole archive matched its SHA-256
+            ZipExtractor.extract_replace(temp_zip_path, extract_to_path, verify_crc=not archive_verified)
 
-            self.root.after(0, lambda: self.log_info("✓ Extraction complete."))
-            
-            try:
-                os.remove(temp_zip_path)
-            except:
-                pass
-            
-            self.root.after(0, lambda: self._on_download_finished(True, "Texture cache downloaded and extracted successfully!"))
+            self.post_log("✓ Extraction complete.")
+            success, message = True, "Texture cache downloaded and extracted successfully!"
 
         except Exception as e:
-            self.root.after(0, lambda: self._on_download_finished(False, f"Download failed: {str(e)}"))
+            success, message = False, f"Download failed: {str(e)}"
+        
+        finally:
+            # A leaked archive is hundreds of MB, so only a missing file is ignored silently
+            try:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(temp_zip_path)
+            except OSError as cleanup_error:
+                self.post_log(f"⚠ Temp cleanup failed: {cleanup_error}")
         
+        self.root.after(0, self._on_download_finished, success, message)
+        
+    def _fetch_expected_digest(self, url):
+        # Release assets ship a "<hash>  <filename>" sidecar; missing sidecar means no check
+        try:
+            with self._http.get(url) as response:
+                text = response.read().decode('ascii', errors='ignore').strip()
+            if text:
+                return text.split()[0].lower()
+        except Exception:
+            pass
+        return None
+
     def _on_download_finished(self, success, message):
+        self._flush_log_queue()
         self.is_downloading = False
         self.download_btn.config(state=tk.NORMAL, text="Download All Textures", bg=self.colors['accent_blue'])
         
@@ -0,0 +1,66 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "EVR_texture_editor.py"
+
+
+@pytest.fixture(scope="module")
+def editor():
+    spec = importlib.util.spec_from_file_location("EVR_texture_editor", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def decode_cache(editor):
+    saved = dict(editor.DECODE_CACHE)
+    editor.DECODE_CACHE.clear()
+    yield editor.DECODE_CACHE
+    editor.DECODE_CACHE.clear()
+    editor.DECODE_CACHE.update(saved)
+
+
+def test_matching_entry_is_used(editor, decode_cache, tmp_path):
+    texture = tmp_path / "texture"
+    texture.write_bytes(b"\0" * 64)
+    editor.ASTCTools.record_decode_config("texture", 8, 8, 4, 4, texture.stat())
+
+    config = editor.ASTCTools.get_decode_config("texture", texture)
+    assert config is not None
+    assert (config['width'], config['height'], config['block_w'], config['block_h']) == (8, 8, 4, 4)
+
+
+def test_stale_entry_is_ignored(editor, decode_cache, tmp_path):
+    texture = tmp_path / "texture"
+    texture.write_bytes(b"\0" * 64)
+    editor.ASTCTools.record_decode_config("texture", 8, 8, 4, 4, texture.stat())
+
+    # A game update replaces the texture with a different size and a newer mtime
+    texture.write_bytes(b"\0" * 128)
+    stat = texture.stat()
+    os.utime(texture, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert editor.ASTCTools.get_decode_config("texture", texture) is None
+    assert not editor.ASTCTools.decode_cached(None, texture, tmp_path, "texture")
+
+
+def test_same_size_rewrite_is_ignored(editor, decode_cache, tmp_path):
+    texture = tmp_path / "texture"
+    texture.write_bytes(b"\0" * 64)
+    editor.ASTCTools.record_decode_config("texture", 8, 8, 4, 4, texture.stat())
+
+    stat = texture.stat()
+    os.utime(texture, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert editor.ASTCTools.get_decode_config("texture", texture) is None
+
+
+def test_entry_from_older_journal_is_ignored(editor, decode_cache, tmp_path):
+    texture = tmp_path / "texture"
+    texture.write_bytes(b"\0" * 64)
+    # Journals written before mtimes were recorded only carry the size
+    decode_cache["texture"] = {'width': 8, 'height': 8, 'block_w': 4, 'block_h': 4, 'original_size': 64}
+
+    assert editor.ASTCTools.get_decode_config("texture", texture) is None